@@ -20,8 +20,13 @@ class SafetyManager:
         self._stop = threading.Event()
         self._callbacks: list[Callable[[], None]] = []
 
+    @property
+    def timeout(self) -> float:
+        """Seconds without a heartbeat before the watchdog stops the motors."""
+        return self._timeout
+
     def start(self) -> None:
-        threading.Thread(target=self._monitor, daemon=True).start()
+        threading.Thread(target=self._monitor, name="safety", daemon=True).start()
 
     def stop(self) -> None:
         self._stop.set()
@@ -45,4 +50,4 @@ class SafetyManager:
                 LOGGER.warning("Watchdog timeout, stopping motors")
                 self.emergency_stop()
                 self._heartbeat = time.time()
-            time.sleep(0.5)
+            self._stop.wait(0.5)  # returns at once when stop() is called
@@ -111,10 +111,19 @@ def mouth_neutral_round(draw) -> None:
                 px_c(draw, x, y + 1)  # thicken
 
 
+def _talk_rows(t: float) -> int:
+    """Half-height of the talking mouth at time t (toggles 1↔2 rows each side)."""
+    return 2 if (math.sin(t * 6) > 0) else 1
+
+
 def mouth_oval_talk(draw, t: float) -> None:
     """Animated oval; height 2–3 rows, centered at row ~6."""
+    _mouth_oval_rows(draw, _talk_rows(t))
+
+
+def _mouth_oval_rows(draw, b: int) -> None:
+    """Draw the talking oval with half-height b."""
     a = max(4, (IN_X2 - IN_X1) // 2 - 1)
-    b = 2 if (math.sin(t * 6) > 0) else 1  # toggle 1↔2 (rows each side)
     cy = 6
     for x in range(IN_X1, IN_X2 + 1):
         dx = (x - MIDX) / a
@@ -130,18 +139,36 @@ def mouth_oval_talk(draw, t: float) -> None:
             px_c(draw, x, y2)
 
 
+def _level_len(t: float) -> int:
+    """Number of lit level-meter pixels at time t."""
+    span = IN_X2 - IN_X1
+    return 2 + int((math.sin(t * 5) + 1) / 2 * span)
+
+
 def level_meter(draw, t: float) -> None:
     """Animated level meter at bottom."""
-    span = IN_X2 - IN_X1
-    n = 2 + int((math.sin(t * 5) + 1) / 2 * span)
+    _level_meter_len(draw, _level_len(t))
+
+
+def _level_meter_len(draw, n: int) -> None:
+    """Draw the level meter with n lit pixels."""
     for x in range(IN_X1, IN_X1 + n):
         px_c(draw, x, 7)
 
 
-def draw_face_frame(draw, device, mode: str, elapsed: float) -> None:
+# Blink timing: half lid then full lid, BLINK_STAGE_S each, every BLINK_PERIOD_S
+BLINK_PERIOD_S = 1.8
+BLINK_STAGE_S = 0.08
+# Frame interval for the continuously animated modes (~8 FPS; the mouth and
+# level meter move a pixel or two per frame, so 16 FPS only doubled SPI writes)
+FRAME_INTERVAL_S = 0.12
+
+
+def _face_state(mode: str, elapsed: float) -> tuple:
     """
-    Draw a single frame of the face animation.
-    mode: 'normal' | 'listening' | 'speaking'
+    Reduce (mode, elapsed) to the discrete values that decide the pixels:
+    (pupil_dir, blink_frame, talk_rows, level_len). Two times with the same
+    state draw identical frames.
     """
     # Eye direction
     if mode == "listening":
@@ -151,30 +178,85 @@ def draw_face_frame(draw, device, mode: str, elapsed: float) -> None:
         pupil_dir = "c"
 
     # Blink state machine
-    next_blink_base = int(elapsed / 1.8) * 1.8
+    next_blink_base = int(elapsed / BLINK_PERIOD_S) * BLINK_PERIOD_S
     blink_offset = elapsed - next_blink_base
-    if 0 <= blink_offset < 0.08:
+    if 0 <= blink_offset < BLINK_STAGE_S:
         blink_frame = 1
-    elif 0.08 <= blink_offset < 0.16:
+    elif BLINK_STAGE_S <= blink_offset < 2 * BLINK_STAGE_S:
         blink_frame = 2
     else:
         blink_frame = 0
 
+    talk_rows = _talk_rows(elapsed) if mode == "speaking" else 0
+    level_len = _level_len(elapsed) if mode in ("speaking", "listening") else 0
+    return (pupil_dir, blink_frame, talk_rows, level_len)
+
+
+def next_frame_change(mode: str, elapsed: float) -> float:
+    """
+    Earliest elapsed time at which the frame for mode can differ from the
+    frame at elapsed. 'normal' only changes at blink edges, so callers can
+    sleep until then instead of ticking at FRAME_INTERVAL_S.
+    """
+    if mode in ("speaking", "listening"):
+        return elapsed + FRAME_INTERVAL_S
+    base = int(elapsed / BLINK_PERIOD_S) * BLINK_PERIOD_S
+    offset = elapsed - base
+    if offset < BLINK_STAGE_S:
+        return base + BLINK_STAGE_S
+    if offset < 2 * BLINK_STAGE_S:
+        return base + 2 * BLINK_STAGE_S
+    return base + BLINK_PERIOD_S
+
+
+def _draw_face_state(draw, mode: str, state: tuple) -> None:
+    """Draw the frame described by a _face_state() tuple."""
+    pupil_dir, blink_frame, talk_rows, level_len = state
+
     # Draw components
     draw_eyes(draw, pupil_dir=pupil_dir, blink_phase=blink_frame)
     nose_block(draw)
 
     # Mouth rows 5..7
     if mode == "speaking":
-        mouth_oval_talk(draw, elapsed)
-        level_meter(draw, elapsed)
+        _mouth_oval_rows(draw, talk_rows)
+        _level_meter_len(draw, level_len)
     elif mode == "listening":
         mouth_neutral_round(draw)
-        level_meter(draw, elapsed)
+        _level_meter_len(draw, level_len)
     else:
         mouth_neutral_round(draw)
 
 
+def draw_face_frame(draw, device, mode: str, elapsed: float) -> None:
+    """
+    Draw a single frame of the face animation.
+    mode: 'normal' | 'listening' | 'speaking'
+    """
+    _draw_face_state(draw, mode, _face_state(mode, elapsed))
+
+
+# Pre-rendered frames keyed by (mode, device mode, device size, face state).
+# "normal" has 3 distinct frames (blink stages); the animated modes a few dozen.
+_FRAME_CACHE: dict = {}
+
+
+def face_frame_image(device, mode: str, elapsed: float):
+    """
+    Return the frame for (mode, elapsed) as a PIL image ready for device.display().
+    Each distinct frame is rasterized once and reused afterwards, so the
+    animation loop becomes a dict lookup plus the SPI write.
+    """
+    state = _face_state(mode, elapsed)
+    key = (mode, device.mode, device.size, state)
+    img = _FRAME_CACHE.get(key)
+    if img is None:
+        img = Image.new(device.mode, device.size)
+        _draw_face_state(ImageDraw.Draw(img), mode, state)
+        _FRAME_CACHE[key] = img
+    return img
+
+
 def draw_text_horizontal(device, text: str, device_orientation: int, speed: float = 0.03) -> None:
     """
     Draw text horizontally (left->right) with rotation support.
@@ -238,11 +320,12 @@ def draw_text_horizontal(device, text: str, device_orientation: int, speed: floa
         time.sleep(1.0)
         return
 
-    # Scroll window across the rotated image
+    # Scroll window across the rotated image: one reusable frame, each
+    # window pasted over the previous one (same size, so no clear needed)
+    frame = Image.new(device.mode, device.size)
     for x in range(0, total + 1):
-        with canvas(device) as drawc:
-            segment = out_img.crop((x, 0, x + dev_w, out_img.height))
-            drawc.bitmap((0, 0), segment, fill=255)
+        frame.paste(out_img.crop((x, 0, x + dev_w, out_img.height)), (0, 0))
+        device.display(frame)
         time.sleep(speed)
 
 
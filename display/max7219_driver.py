@@ -24,6 +24,9 @@ USE_SIM = CONFIG["services"]["runtime"].get("use_simulator", False)
 _DEVICE = None
 _SERIAL = None
 _DETECTED = {"port": None, "device": None, "cascaded": None}
+# (device, image) last pushed by display_frame(); cached face frames are
+# reused objects, so an unchanged frame is recognised by identity
+_LAST_FRAME = (None, None)
 
 
 def _list_spidev_nodes():
@@ -100,12 +103,13 @@ def init_display(force=False):
     Initialize display device. If already initialized and not forced, return existing.
     In dev mode this is a no-op (logs only).
     """
-    global _DEVICE
+    global _DEVICE, _LAST_FRAME
     if _DEVICE is not None and not force:
         return _DEVICE
     if USE_SIM:
         LOGGER.info("init_display: simulator mode, no hardware init")
         return None
+    _LAST_FRAME = (None, None)
     _DEVICE = _auto_detect_and_init()
     return _DEVICE
 
@@ -118,6 +122,25 @@ def _require_device():
     return _DEVICE
 
 
+def display_frame(dev, image) -> bool:
+    """
+    Push a full frame image to the device, skipping the SPI write when the
+    same frame is already on the matrix. Returns True if the frame was written.
+    """
+    global _LAST_FRAME
+    if _LAST_FRAME[0] is dev and _LAST_FRAME[1] is image:
+        return False
+    dev.display(image)
+    _LAST_FRAME = (dev, image)
+    return True
+
+
+def _invalidate_frame():
+    """Forget the last pushed frame after drawing through luma's canvas."""
+    global _LAST_FRAME
+    _LAST_FRAME = (None, None)
+
+
 def show_text(text: str, speed: float = None):
     """
     Show text with robust rendering: create horizontal image, rotate by ORIENTATION, scroll.
@@ -125,6 +148,7 @@ def show_text(text: str, speed: float = None):
     if USE_SIM:
         LOGGER.info("show_text(sim): %s", text)
         return
+    _invalidate_frame()
     
     if speed is None:
         speed = SCROLL_SPEED
@@ -195,11 +219,12 @@ def show_text(text: str, speed: float = None):
         time.sleep(1.0)
         return
     
-    # Scroll window across the rotated image
+    # Scroll window across the rotated image: one reusable frame, each
+    # window pasted over the previous one (same size, so no clear needed)
+    frame = Image.new(dev.mode, dev.size)
     for x in range(0, total_scroll + 1):
-        with canvas(dev) as drawc:
-            segment = rotated_img.crop((x, 0, x + dev_w, rotated_img.height))
-            drawc.bitmap((0, 0), segment, fill=255)
+        frame.paste(rotated_img.crop((x, 0, x + dev_w, rotated_img.height)), (0, 0))
+        dev.display(frame)
         time.sleep(speed)
 
 
@@ -214,8 +239,7 @@ def show_expression(name: str, duration_s: float = 1.2):
     dev = _require_device()
 
     # Use expressions from display.expressions module
-    from display.expressions import draw_face_frame
-    from luma.core.render import canvas
+    from display.expressions import face_frame_image, next_frame_change
 
     # Map expression names to modes
     mode_map = {
@@ -229,11 +253,14 @@ def show_expression(name: str, duration_s: float = 1.2):
     }
     mode = mode_map.get(name, "normal")
 
-    t0 = time.time()
-    while time.time() - t0 < duration_s:
-        with canvas(dev) as draw:
-            draw_face_frame(draw, dev, mode, time.time() - t0)
-        time.sleep(0.06)
+    t0 = time.monotonic()
+    while True:
+        elapsed = time.monotonic() - t0
+        if elapsed >= duration_s:
+            break
+        display_frame(dev, face_frame_image(dev, mode, elapsed))
+        # Sleep until the face can next change
+        time.sleep(min(next_frame_change(mode, elapsed), duration_s) - elapsed)
 
 
 def clear():
@@ -242,6 +269,7 @@ def clear():
         LOGGER.info("clear(sim)")
         return
     dev = _require_device()
+    _invalidate_frame()
     from luma.core.render import canvas
     with canvas(dev) as draw:
         draw.rectangle((0, 0, dev.width - 1, dev.height - 1), outline=0, fill=0)
@@ -84,14 +84,20 @@ def main() -> None:
 
         # Publish session end to MQTT
         mqtt.publish("session/end", session_id)
-        mqtt.publish("session/results", str(final_results))
+        mqtt.publish(
+            "session/results",
+            str({
+                **final_results,
+                "execution_log": [entry._asdict() for entry in final_results["execution_log"]],
+            }),
+        )
 
         # Log execution summary (simplified)
         for log_entry in final_results["execution_log"]:
             LOGGER.info(
                 "Module %s: completed=%s",
-                log_entry["module_name"],
-                log_entry["completed"],
+                log_entry.module_name,
+                log_entry.completed,
             )
 
     except KeyboardInterrupt:
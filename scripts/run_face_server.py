@@ -6,8 +6,9 @@ Run this once at boot (via systemd tokymon-face.service).  It:
   1. Starts the HTTP face server on port 8080  (ui_server.py, unchanged)
   2. Runs a background file-watcher thread that polls
      /tmp/tokymon/face_state.json every 50 ms and updates the server's
-     in-process _ui_state dict when the mode changes.  The SSE endpoint in
-     ui_server.py then pushes the change to the browser within ~10 ms.
+     in-process face state (ui_server.set_face_mode) when the mode changes.
+     That wakes the SSE streams in ui_server.py, which push the change to
+     the browser immediately.
 
 Session scripts (basic_commands, future modules, etc.) update the face by
 writing to /tmp/tokymon/face_state.json via sessions.modules.face_state.
@@ -46,8 +47,8 @@ POLL_INTERVAL = 0.05   # 50 ms — face change reaches browser in ≤ 60 ms tota
 def _file_watcher() -> None:
     """Background thread: poll state file, update ui_server's in-process dict.
 
-    ui_server.py's SSE loop already watches _ui_state every 10 ms and pushes
-    on change — so all we need to do here is keep that dict in sync with the
+    set_face_mode() wakes ui_server.py's SSE streams, which push on change —
+    so all we need to do here is keep the server state in sync with the
     file written by session scripts.
     """
     last_mode: str = "waiting"
@@ -56,9 +57,7 @@ def _file_watcher() -> None:
         try:
             mode = face_state.read()
             if mode != last_mode:
-                with _ui_srv._ui_lock:
-                    _ui_srv._ui_state["face_mode"] = mode
-                    _ui_srv._ui_state["last_update"] = time.time()
+                _ui_srv.set_face_mode(mode)
                 last_mode = mode
         except Exception:
             pass   # Log nothing — tight loop, errors are transient
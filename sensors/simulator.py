@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import itertools
+from typing import List
 
 _FAKE_DISTANCES_CM = [30.0, 45.0, 50.0]
 DISTANCE_SEQ = itertools.cycle(_FAKE_DISTANCES_CM)
@@ -11,5 +12,10 @@ def read_distance_cm() -> float:
     return next(DISTANCE_SEQ)
 
 
+def read_distance_cm_batch(n: int) -> List[float]:
+    """Next n readings of the same sequence as read_distance_cm(), in one call."""
+    return list(itertools.islice(DISTANCE_SEQ, n))
+
+
 def read_ir(channel: str) -> bool:
     return channel == "left"
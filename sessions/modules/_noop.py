@@ -0,0 +1,31 @@
+"""Shared implementation for modules that are still thin adapters."""
+from __future__ import annotations
+
+from sessions.modules.base import BaseModule, ModuleResult
+
+
+class NoopModule(BaseModule):
+    """
+    Thin adapter module: logs start/end and completes immediately.
+    Subclasses only set MODULE_NAME.
+    """
+
+    MODULE_NAME = ""
+
+    def __init__(self) -> None:
+        super().__init__(self.MODULE_NAME)
+
+    def enter(self) -> None:
+        """Log module start."""
+        self.logger.info("Module start: %s", self.module_name)
+
+    def run(self) -> ModuleResult:
+        """Complete immediately unless a stop was requested."""
+        self._set_running(True)
+        completed = not self._stop_requested
+        self._set_running(False)
+        return ModuleResult(completed=completed, engagement=None)
+
+    def exit(self) -> None:
+        """Log module end."""
+        self.logger.info("Module end: %s", self.module_name)
@@ -1,6 +1,7 @@
 """Base module interface for all session modules."""
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
@@ -30,6 +31,8 @@ class BaseModule(ABC):
         self.logger = get_logger(f"module.{module_name}")
         self._is_running = False
         self._stop_requested = False
+        # Set together with _stop_requested so blocking waits can wake early
+        self._stop_event = threading.Event()
 
     @abstractmethod
     def enter(self) -> None:
@@ -65,6 +68,7 @@ class BaseModule(ABC):
     def request_stop(self) -> None:
         """Request the module to stop gracefully."""
         self._stop_requested = True
+        self._stop_event.set()
         self.logger.info("Stop requested for module %s", self.module_name)
 
     @property
@@ -1,17 +1,33 @@
 """Basic Commands & Robot Interaction module."""
 from __future__ import annotations
 
+import os
+import queue
 import random
 import subprocess
 import time
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait as futures_wait
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+# LED stack (luma) is optional; resolved once instead of on every animation
+try:
+    import luma.core.render  # noqa: F401
+    _LUMA_AVAILABLE = True
+except ImportError:
+    _LUMA_AVAILABLE = False
 
 from control import motors
 from control.safety import SafetyManager
 from display import expressions, max7219_driver
 from sessions.modules.base import BaseModule, ModuleResult
+from sessions.modules.face_state import write as _write_face_state
 from sensors.interface import get_ultrasonic_reader
 from sensors.drivers import hcsr04_back
 from system.config import CONFIG
@@ -21,7 +37,43 @@ from vision import face_detector
 
 LOGGER = get_logger("basic_commands")
 
-_ui_lock = threading.Lock()
+USE_SIM = bool(CONFIG["services"]["runtime"].get("use_simulator", False))
+
+# Upper bound for a background LED animation; normally stopped much earlier
+_LED_ANIMATION_MAX_S = 15.0
+
+# Niceness increment for the background LED thread (motors/safety keep priority)
+_LED_THREAD_NICE = 5
+
+# Background LED thread and its job queue of (mode, stop_event, done_event)
+_led_jobs: "queue.Queue" = queue.Queue()
+_led_thread: Optional[threading.Thread] = None
+_led_thread_lock = threading.Lock()
+
+# Watchdog feed interval while waiting; never more than a quarter of the
+# SafetyManager timeout, so jitter or a slow driver call can't trip it
+_HEARTBEAT_INTERVAL_S = 0.3
+
+# Stop event of the running BasicCommandsModule; lets sleeps end immediately
+# when the orchestrator requests a stop
+_stop_event = threading.Event()
+
+# Long-lived single-thread workers by job type (see _get_executor)
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+# Simulator face rolls are generated in bulk and consumed one per detection
+_SIM_ROLL_BATCH = 4096
+_sim_rolls: list = []
+_sim_rolls_lock = threading.Lock()
+
+# Private RNG for simulator rolls so they don't share (or disturb) the global
+# random state; set runtime.sim_seed for reproducible runs
+_SIM_SEED = CONFIG["services"]["runtime"].get("sim_seed")
+if np is not None:
+    _sim_rng = np.random.default_rng(_SIM_SEED)
+else:
+    _sim_rng = random.Random(_SIM_SEED)
 
 
 def _update_ui_face(mode: str) -> None:
@@ -32,7 +84,6 @@ def _update_ui_face(mode: str) -> None:
     # Wrapped in try/except — file write is non-critical; in-process dict
     # update above is already done and cannot be undone by this failing.
     try:
-        from sessions.modules.face_state import write as _write_face_state
         _write_face_state(mode)
     except Exception:
         pass
@@ -47,7 +98,6 @@ def _play_prompt(filename: str, safety: Optional[SafetyManager]) -> None:
     prompt_path = Path("voice_prompts/en_wav") / filename
     
     # Check simulator mode
-    USE_SIM = CONFIG["services"]["runtime"].get("use_simulator", False)
     if USE_SIM:
         LOGGER.info("Voice prompt (sim): %s", filename)
         _safe_sleep(1.0, safety)  # Simulate playback time
@@ -58,12 +108,16 @@ def _play_prompt(filename: str, safety: Optional[SafetyManager]) -> None:
             cmd = ["aplay", "-D", SPEAKER_DEVICE, str(prompt_path)]
             # Send heartbeats during playback
             proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            # Monitor process and send heartbeats
-            while proc.poll() is None:
+            # Monitor process and send heartbeats; wait() returns as soon
+            # as playback ends
+            while True:
                 if safety:
                     safety.heartbeat()
-                time.sleep(0.1)
-            proc.wait()
+                try:
+                    proc.wait(timeout=_HEARTBEAT_INTERVAL_S)
+                    break
+                except subprocess.TimeoutExpired:
+                    continue
             LOGGER.info("Voice prompt played: %s", filename)
         except FileNotFoundError:
             LOGGER.warning("aplay not found; falling back to simulated playback")
@@ -80,19 +134,44 @@ def _safe_sleep(seconds: float, safety: Optional[SafetyManager]) -> None:
     """
     Sleep while continuously feeding the watchdog.
     Prevents watchdog timeout during long operations.
-    Sends heartbeats every 0.05s to ensure watchdog never times out (timeout is 2s).
+    Waits on _stop_event in slices of _HEARTBEAT_INTERVAL_S (at most a
+    quarter of the watchdog timeout), sending a heartbeat per slice, so a
+    stop request ends the sleep immediately.
+    Without a safety manager the whole duration is a single wait.
     """
     if seconds <= 0:
         return
-    
-    end_time = time.time() + seconds
-    while time.time() < end_time:
+
+    if safety:
+        interval = _HEARTBEAT_INTERVAL_S
+        timeout = getattr(safety, "timeout", 0)
+        if timeout > 0:
+            interval = min(interval, timeout / 4)
+    else:
+        interval = seconds
+    # Monotonic clock so NTP steps can't stretch or cut the sleep
+    end_time = time.monotonic() + seconds
+    while True:
         if safety:
             safety.heartbeat()
-        # Sleep in smaller chunks to ensure frequent heartbeats
-        sleep_time = min(0.05, end_time - time.time())  # Max 50ms, or remaining time
-        if sleep_time > 0:
-            time.sleep(sleep_time)
+        remaining = end_time - time.monotonic()
+        if remaining <= 0:
+            break
+        if _stop_event.wait(min(interval, remaining)):
+            break
+
+
+def _sim_face_roll() -> bool:
+    """Next simulated detection result (70% chance face visible)."""
+    global _sim_rolls
+    # Detections run on executor threads; refill and pop must not interleave
+    with _sim_rolls_lock:
+        if not _sim_rolls:
+            if np is not None:
+                _sim_rolls = (_sim_rng.random(_SIM_ROLL_BATCH) > 0.3).tolist()
+            else:
+                _sim_rolls = [_sim_rng.random() > 0.3 for _ in range(_SIM_ROLL_BATCH)]
+        return _sim_rolls.pop()
 
 
 def _detect_face_binary(context: str, safety: Optional[SafetyManager], retries: int = 2) -> bool:
@@ -100,21 +179,15 @@ def _detect_face_binary(context: str, safety: Optional[SafetyManager], retries:
     Binary face detection - returns True if face present, False otherwise.
     Uses real OpenCV Haar Cascade detection with retry logic.
     """
-    USE_SIM = CONFIG["services"]["runtime"].get("use_simulator", False)
-    
     if USE_SIM:
         # Simulator: randomly return True/False for testing
-        result = random.random() > 0.3  # 70% chance face visible
+        result = _sim_face_roll()  # 70% chance face visible
         LOGGER.info("Face visible (%s, sim): %s", context, result)
         return result
     
     # Production: real face detection with retries
     for attempt in range(retries + 1):
         try:
-            # Heartbeat before camera capture
-            if safety:
-                safety.heartbeat()
-            
             # Capture frame with periodic heartbeats during capture
             # Camera capture can take up to 5 seconds, so we need to send heartbeats
             frame = _capture_frame_with_heartbeat(context, safety)
@@ -126,10 +199,6 @@ def _detect_face_binary(context: str, safety: Optional[SafetyManager], retries:
                     continue
                 return False
             
-            # Heartbeat after capture
-            if safety:
-                safety.heartbeat()
-            
             # Detect face (should be fast, but send heartbeat just in case)
             face_visible = face_detector.face_present(frame, context=context)
             if safety:
@@ -156,48 +225,132 @@ def _detect_face_binary(context: str, safety: Optional[SafetyManager], retries:
     return False
 
 
+def _wait_for_face(context: str, settle_s: float, safety: Optional[SafetyManager]) -> bool:
+    """
+    Face check after the robot stops. Tries once right away and only waits
+    settle_s (for the chassis to stop rocking) before the remaining retries
+    if that first look found nothing: three captures in total, as before.
+    In simulator mode the first roll is the answer: a second roll would
+    raise the odds of "seeing" a face from 0.7 to about 0.91.
+    """
+    if _detect_face_binary(context, safety, retries=0):
+        return True
+    _safe_sleep(settle_s, safety)
+    if USE_SIM:
+        return False
+    return _detect_face_binary(context, safety, retries=1)
+
+
+def _start_face_detection(context: str, safety: Optional[SafetyManager]) -> Future:
+    """
+    Run _detect_face_binary on the background "face" worker so the camera
+    capture overlaps whatever the caller does next (e.g. an observation
+    wait). Collect the result with _finish_face_detection().
+    """
+    return _get_executor("face").submit(_detect_face_binary, context, safety)
+
+
+def _finish_face_detection(probe: Future, safety: Optional[SafetyManager]) -> bool:
+    """Wait for a detection from _start_face_detection(), feeding the watchdog."""
+    while not probe.done():
+        if safety:
+            safety.heartbeat()
+        futures_wait((probe,), timeout=_HEARTBEAT_INTERVAL_S)
+    if safety:
+        safety.heartbeat()
+    return probe.result()
+
+
+def _observe_face(context: str, window_s: float, safety: Optional[SafetyManager]) -> bool:
+    """
+    Observation window with a face check running in the background.
+    Returns as soon as a face is seen; otherwise waits out window_s (or a
+    stop request) and returns the detection result.
+    """
+    probe = _start_face_detection(context, safety)
+    deadline = time.monotonic() + window_s
+    while True:
+        if safety:
+            safety.heartbeat()
+        if probe.done() and probe.result():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or _stop_event.is_set():
+            break
+        wait = min(_HEARTBEAT_INTERVAL_S, remaining)
+        if not probe.done():
+            futures_wait((probe,), timeout=wait)
+        else:
+            _stop_event.wait(wait)
+    return _finish_face_detection(probe, safety)
+
+
+def _get_executor(name: str) -> ThreadPoolExecutor:
+    """
+    Single-thread worker for a background job type ("cam", "face"), created
+    on first use and reused. Separate workers keep a face check (which
+    submits its own capture) from waiting on itself.
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+            _executors[name] = executor
+        return executor
+
+
+def _shutdown_executors() -> None:
+    """Release the background workers (new ones are created on next use)."""
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=False)
+        _executors.clear()
+
+
 def _capture_frame_with_heartbeat(context: str, safety: Optional[SafetyManager]) -> Optional[object]:
     """
     Capture frame while sending heartbeats during the blocking operation.
-    Uses threading to monitor camera capture and send heartbeats.
+    The capture runs on the shared camera worker; exceptions are re-raised here.
     """
-    import threading
-    
-    frame_result = [None]
-    capture_error = [None]
-    
-    def capture_worker():
-        """Worker thread to capture frame."""
-        try:
-            frame_result[0] = camera.capture_frame_np(context=context)
-        except Exception as exc:
-            capture_error[0] = exc
-    
-    # Start capture in thread
-    capture_thread = threading.Thread(target=capture_worker, daemon=True)
-    capture_thread.start()
-    
-    # Send heartbeats while waiting for capture to complete
-    # Check every 50ms and send heartbeat to ensure watchdog is fed
-    while capture_thread.is_alive():
+    future = _get_executor("cam").submit(camera.capture_frame_np, context=context)
+
+    # Send heartbeats while waiting for capture to complete; wait() returns
+    # as soon as the capture finishes
+    while not future.done():
         if safety:
             safety.heartbeat()
-        capture_thread.join(timeout=0.05)  # Check every 50ms
+        futures_wait((future,), timeout=_HEARTBEAT_INTERVAL_S)
     
     # Final heartbeat
     if safety:
         safety.heartbeat()
     
-    if capture_error[0]:
-        raise capture_error[0]
-    
-    return frame_result[0]
+    return future.result()
+
 
+def _show_face_led(
+    mode: str,
+    duration: float = 1.0,
+    safety: Optional[SafetyManager] = None,
+    stop_event: Optional[threading.Event] = None,
+) -> None:
+    """Show face animation on LED matrix with watchdog heartbeats.
+
+    If ``stop_event`` is given the animation also ends as soon as it is set,
+    which is how the background animation from ``_start_face_led`` is stopped.
+    Otherwise it ends early on the module stop request (``_stop_event``).
+    """
+    if stop_event is None:
+        stop_event = _stop_event
+    if not _LUMA_AVAILABLE:
+        # luma not available - graceful degradation
+        LOGGER.debug("LED display library not available (simulator/dev mode)")
+        # Still send heartbeats during LED duration even if LED unavailable
+        if safety:
+            _safe_sleep(duration, safety)
+        return
 
-def _show_face_led(mode: str, duration: float = 1.0, safety: Optional[SafetyManager] = None) -> None:
-    """Show face animation on LED matrix with watchdog heartbeats."""
     try:
-        from luma.core.render import canvas
         device = max7219_driver.init_display()
         if device is None:
             LOGGER.debug("LED device not available (simulator)")
@@ -206,30 +359,26 @@ def _show_face_led(mode: str, duration: float = 1.0, safety: Optional[SafetyMana
                 _safe_sleep(duration, safety)
             return
         
-        start_time = time.time()
-        frame_count = 0
-        last_heartbeat = time.time()
-        while time.time() - start_time < duration:
-            elapsed = time.time() - start_time
-            with canvas(device) as draw:
-                expressions.draw_face_frame(draw, device, mode, elapsed)
-            
-            frame_count += 1
-            # Send heartbeat at least every 0.3s (well within 2s timeout)
-            # More frequent heartbeats to prevent watchdog timeouts
-            current_time = time.time()
-            if safety and (current_time - last_heartbeat >= 0.3 or frame_count % 5 == 0):
+        start_time = time.monotonic()
+        while True:
+            elapsed = time.monotonic() - start_time
+            if elapsed >= duration or stop_event.is_set():
+                break
+            # Frames are rendered once per distinct image and reused; an
+            # unchanged frame is not re-sent over SPI
+            max7219_driver.display_frame(
+                device, expressions.face_frame_image(device, mode, elapsed)
+            )
+            if safety:
                 safety.heartbeat()
-                last_heartbeat = current_time
-            
-            # Use regular sleep for frame delay (we're already heartbeating)
-            time.sleep(0.06)  # ~16 FPS
-    except ImportError:
-        # luma not available - graceful degradation
-        LOGGER.debug("LED display library not available (simulator/dev mode)")
-        # Still send heartbeats during LED duration even if LED unavailable
-        if safety:
-            _safe_sleep(duration, safety)
+
+            # Sleep until the face can next change ('normal' only changes at
+            # blinks), waking at least every 0.3s to feed the watchdog
+            wait = expressions.next_frame_change(mode, elapsed) - elapsed
+            if safety:
+                wait = min(wait, _HEARTBEAT_INTERVAL_S)
+            if stop_event.wait(min(wait, duration - elapsed)):
+                break
     except Exception as exc:
         LOGGER.warning("LED face display error: %s", exc)
         # Fallback: use safe_sleep if LED fails
@@ -237,216 +386,242 @@ def _show_face_led(mode: str, duration: float = 1.0, safety: Optional[SafetyMana
             _safe_sleep(duration, safety)
 
 
-def _perform_safe_command(command: str, safety: Optional[SafetyManager]) -> None:
+def _led_worker_main() -> None:
     """
-    Perform a safe robot command.
-    Commands: greeting, forward, backward, turn_left, turn_right, stop
+    Persistent LED thread body: pin the thread to the last CPU and lower its
+    priority once, then play queued animations one at a time. On Linux both
+    calls apply to the calling thread only; failures (other OSes,
+    containers) are ignored.
     """
-    LOGGER.info("Command demonstrated: %s", command)
+    try:
+        cpus = os.sched_getaffinity(0)
+        if len(cpus) > 1:
+            os.sched_setaffinity(0, {max(cpus)})
+        os.nice(_LED_THREAD_NICE)
+    except (AttributeError, OSError):
+        pass
+    while True:
+        mode, stop_event, done = _led_jobs.get()
+        try:
+            _show_face_led(mode, _LED_ANIMATION_MAX_S, stop_event=stop_event)
+        finally:
+            done.set()
 
-    # Ensure motors are in a safe stopped state before every command
-    motors.reset_to_safe()
 
-    # Get singleton motor driver
-    driver = motors._get_driver() if hasattr(motors, '_get_driver') else motors.MotorDriver()
-    
-    if command == "greeting":
-        # Play greeting prompt (first prompt)
-        _play_prompt("bc_01_greeting_hello.wav", safety)
-        # No movement, just face animation
-        _update_ui_face("greeting")
-        _show_face_led("normal", duration=2.0, safety=safety)
-        _update_ui_face("normal_smile")
-        return
-    
-    if command == "forward":
-        # Play forward demo prompt
-        _play_prompt("bc_05_demo_forward.wav", safety)
-        _update_ui_face("moving")
-        _show_face_led("normal", duration=0.2, safety=safety)
-        if safety:
-            safety.heartbeat()
-        driver.forward(speed=100)  # Full speed (100%)
-        if safety:
-            safety.heartbeat()
-        # Continuous distance monitoring with ultrasonic brake
-        ultrasonic_reader = get_ultrasonic_reader()
-        start_time = time.time()
-        last_ultrasonic_time = 0
-        distances_logged = []
-        while time.time() - start_time < 3.0:  # 3 seconds duration
-            if safety:
-                safety.heartbeat()
-            
-            # Check distance (HC-SR04 needs ~60ms between readings)
-            current_time = time.time()
-            if current_time - last_ultrasonic_time >= 0.06:  # Minimum 60ms between readings
-                distance = ultrasonic_reader()
-                last_ultrasonic_time = current_time
-                if distance > 0:
-                    distances_logged.append(distance)
-                    LOGGER.info("Ultrasonic distance during forward: %.1f cm", distance)
-                elif distance == -1:
-                    LOGGER.debug("Ultrasonic timeout during forward")
-                if distance > 0 and distance < 20:  # Valid reading and too close — 20cm is safe for forward (slower approach)
-                    LOGGER.warning("Ultrasonic brake triggered: distance=%.1f cm", distance)
-                    driver.brake()
-                    break
-            
-            # Sleep in small chunks to allow frequent checks
-            _safe_sleep(0.05, safety)  # Reduced to 50ms for more responsive checks
-        else:
-            # Normal completion after 3 seconds
-            driver.brake()
-        if safety:
-            safety.heartbeat()
-        
-        # Log final distance after command
-        final_distance = ultrasonic_reader()
-        if final_distance > 0:
-            LOGGER.info("Ultrasonic distance after forward: %.1f cm", final_distance)
-        elif final_distance == -1:
-            LOGGER.debug("Ultrasonic timeout after forward")
-        if distances_logged:
-            avg_distance = sum(distances_logged) / len(distances_logged)
-            LOGGER.info("Average ultrasonic distance during forward: %.1f cm (from %d readings)", 
-                       avg_distance, len(distances_logged))
-        else:
-            LOGGER.warning("No valid ultrasonic readings during forward command")
-        
-        _update_ui_face("normal_smile")
-        _show_face_led("normal", duration=0.2, safety=safety)
-        # Play positive feedback
-        _play_prompt("bc_10_demo_positive.wav", safety)
-    
-    elif command == "backward":
-        # Play backward demo prompt
-        _play_prompt("bc_06_demo_backward.wav", safety)
-        _update_ui_face("moving")
-        _show_face_led("normal", duration=0.2, safety=safety)
-        if safety:
-            safety.heartbeat()
-        driver.backward(speed=100)  # Full speed (100%)
+def _start_face_led(mode: str) -> Tuple[threading.Event, threading.Event]:
+    """
+    Queue the LED face animation on the background LED thread (started on
+    first use). The animation runs alongside motor actions until
+    _stop_face_led() is called (capped at _LED_ANIMATION_MAX_S). Heartbeats
+    stay with the calling thread.
+    """
+    global _led_thread
+    with _led_thread_lock:
+        if _led_thread is None:
+            _led_thread = threading.Thread(target=_led_worker_main, name="led", daemon=True)
+            _led_thread.start()
+    stop_event = threading.Event()
+    done = threading.Event()
+    _led_jobs.put((mode, stop_event, done))
+    return done, stop_event
+
+
+def _stop_face_led(animation: Tuple[threading.Event, threading.Event]) -> None:
+    """Stop a background LED animation started by _start_face_led()."""
+    done, stop_event = animation
+    stop_event.set()
+    done.wait(timeout=0.5)
+
+
+# Movement commands: command -> (demo prompt, driver steps, ultrasonic brake).
+# Driver steps are (method name, *args) tuples applied in order; the brake is
+# (sensor, threshold_cm) or None for time-only moves.
+_MOTION_COMMANDS = {
+    "forward": (
+        "bc_05_demo_forward.wav",
+        (("forward", 100),),  # Full speed (100%)
+        ("front", 20.0),  # 20cm is safe for forward (slower approach)
+    ),
+    "backward": (
+        "bc_06_demo_backward.wav",
+        (("backward", 100),),  # Full speed (100%)
+        ("back", 35.0),  # extra margin needed at full speed going backward
+    ),
+    # A='forward' + B='backward' = physical LEFT turn (chassis pins are reversed)
+    "turn_left": (
+        "bc_07_demo_turn_left.wav",
+        (("set_direction", "A", "forward"), ("set_direction", "B", "backward"),
+         ("set_motor_speed", 100, 100)),
+        None,
+    ),
+    # A='backward' + B='forward' = physical RIGHT turn (chassis pins are reversed)
+    "turn_right": (
+        "bc_08_demo_turn_right.wav",
+        (("set_direction", "A", "backward"), ("set_direction", "B", "forward"),
+         ("set_motor_speed", 100, 100)),
+        None,
+    ),
+}
+_MOTION_DURATION_S = 3.0
+
+# Commands demonstrated after the greeting, in order
+_DEMO_COMMANDS = ("forward", "backward", "turn_left", "turn_right", "stop")
+
+
+def _distance_reader(sensor: str):
+    """Return the distance reader for the front or back ultrasonic sensor."""
+    if sensor == "back":
+        return hcsr04_back.read_distance_cm
+    return get_ultrasonic_reader()
+
+
+def _drive_with_ultrasonic_brake(
+    driver, command: str, sensor: str, threshold_cm: float, safety: Optional[SafetyManager]
+) -> None:
+    """Keep moving for _MOTION_DURATION_S, braking early if an obstacle is closer than threshold_cm."""
+    ultrasonic_reader = _distance_reader(sensor)
+    deadline = time.monotonic() + _MOTION_DURATION_S
+    last_ultrasonic_time = float("-inf")
+    distances_logged = []
+    while not _stop_event.is_set() and (now := time.monotonic()) < deadline:
         if safety:
             safety.heartbeat()
-        # Continuous distance monitoring with back ultrasonic brake
-        start_time = time.time()
-        last_ultrasonic_time = 0
-        distances_logged = []
-        while time.time() - start_time < 3.0:  # 3 seconds duration
-            if safety:
-                safety.heartbeat()
-
-            # Check distance (HC-SR04 needs ~60ms between readings)
-            current_time = time.time()
-            if current_time - last_ultrasonic_time >= 0.06:  # Minimum 60ms between readings
-                distance = hcsr04_back.read_distance_cm()
-                last_ultrasonic_time = current_time
-                if distance > 0:
-                    distances_logged.append(distance)
-                    LOGGER.info("Ultrasonic distance during backward: %.1f cm", distance)
-                elif distance == -1:
-                    LOGGER.debug("Ultrasonic timeout during backward")
-                if distance > 0 and distance < 35:  # 35cm threshold — extra margin needed at full speed going backward
-                    LOGGER.warning("Ultrasonic brake triggered: distance=%.1f cm", distance)
-                    driver.brake()
-                    break
 
-            # Sleep in small chunks to allow frequent checks
-            _safe_sleep(0.05, safety)  # Reduced to 50ms for more responsive checks
-        else:
-            # Normal completion after 3 seconds
-            driver.brake()
-        if safety:
-            safety.heartbeat()
+        # Check distance (HC-SR04 needs ~60ms between readings)
+        if now - last_ultrasonic_time >= 0.06:  # Minimum 60ms between readings
+            distance = ultrasonic_reader()
+            last_ultrasonic_time = now
+            if distance > 0:
+                distances_logged.append(distance)
+                # Per-reading (~16/s); the average below is logged at INFO
+                LOGGER.debug("Ultrasonic distance during %s: %.1f cm", command, distance)
+            elif distance == -1:
+                LOGGER.debug("Ultrasonic timeout during %s", command)
+            if distance > 0 and distance < threshold_cm:  # Valid reading and too close
+                LOGGER.warning("Ultrasonic brake triggered: distance=%.1f cm", distance)
+                driver.brake()
+                break
 
-        # Log final distance after command
-        final_distance = hcsr04_back.read_distance_cm()
-        if final_distance > 0:
-            LOGGER.info("Ultrasonic distance after backward: %.1f cm", final_distance)
-        elif final_distance == -1:
-            LOGGER.debug("Ultrasonic timeout after backward")
-        if distances_logged:
-            avg_distance = sum(distances_logged) / len(distances_logged)
-            LOGGER.info("Average ultrasonic distance during backward: %.1f cm (from %d readings)",
-                       avg_distance, len(distances_logged))
-        else:
-            LOGGER.warning("No valid ultrasonic readings during backward command")
-        
-        _update_ui_face("normal_smile")
-        _show_face_led("normal", duration=0.2, safety=safety)
-        # Play positive feedback
-        _play_prompt("bc_10_demo_positive.wav", safety)
-    
-    elif command == "turn_left":
-        # Play turn left demo prompt
-        _play_prompt("bc_07_demo_turn_left.wav", safety)
-        _update_ui_face("moving")
-        _show_face_led("normal", duration=0.15, safety=safety)
-        if safety:
-            safety.heartbeat()
-        # Set direction for turn left, then override speed to 100%
-        # A='forward' + B='backward' = physical LEFT turn (chassis pins are reversed)
-        driver.set_direction('A', 'forward')
-        driver.set_direction('B', 'backward')
-        driver.set_motor_speed(100, 100)  # Full speed (100%)
-        if safety:
-            safety.heartbeat()
-        # Send heartbeats continuously during movement
-        _safe_sleep(3.0, safety)  # 3 seconds
-        driver.brake()
-        if safety:
-            safety.heartbeat()
-        _update_ui_face("normal_smile")
-        _show_face_led("normal", duration=0.2, safety=safety)
-        # Play positive feedback
-        _play_prompt("bc_10_demo_positive.wav", safety)
-    
-    elif command == "turn_right":
-        # Play turn right demo prompt
-        _play_prompt("bc_08_demo_turn_right.wav", safety)
-        _update_ui_face("moving")
-        _show_face_led("normal", duration=0.15, safety=safety)
-        if safety:
-            safety.heartbeat()
-        # Set direction for turn right, then override speed to 100%
-        # A='backward' + B='forward' = physical RIGHT turn (chassis pins are reversed)
-        driver.set_direction('A', 'backward')
-        driver.set_direction('B', 'forward')
-        driver.set_motor_speed(100, 100)  # Full speed (100%)
-        if safety:
-            safety.heartbeat()
-        # Send heartbeats continuously during movement
-        _safe_sleep(3.0, safety)  # 3 seconds
+        # Sleep in small chunks to allow frequent checks
+        _safe_sleep(0.05, safety)  # Reduced to 50ms for more responsive checks
+    else:
+        # Normal completion after the full duration
         driver.brake()
+
+    # Log final distance after command
+    final_distance = ultrasonic_reader()
+    if final_distance > 0:
+        LOGGER.info("Ultrasonic distance after %s: %.1f cm", command, final_distance)
+    elif final_distance == -1:
+        LOGGER.debug("Ultrasonic timeout after %s", command)
+    if distances_logged:
+        avg_distance = sum(distances_logged) / len(distances_logged)
+        LOGGER.info("Average ultrasonic distance during %s: %.1f cm (from %d readings)",
+                   command, avg_distance, len(distances_logged))
+    else:
+        LOGGER.warning("No valid ultrasonic readings during %s command", command)
+
+
+def _resolve_driver(driver=None):
+    """
+    Return driver, or the motors singleton when None. Looked up on each call
+    rather than cached: motors.cleanup() drops the singleton at session end.
+    """
+    return driver if driver is not None else motors._get_driver()
+
+
+def _do_greeting(driver, command: str, safety: Optional[SafetyManager]) -> None:
+    """Greeting: prompt and face animation, no movement."""
+    # Play greeting prompt (first prompt)
+    _play_prompt("bc_01_greeting_hello.wav", safety)
+    # No movement, just face animation
+    _update_ui_face("greeting")
+    _show_face_led("normal", duration=2.0, safety=safety)
+    _update_ui_face("normal_smile")
+
+
+def _do_motion(driver, command: str, safety: Optional[SafetyManager]) -> None:
+    """Run a _MOTION_COMMANDS entry: prompt, driver steps, timed or ultrasonic brake."""
+    prompt, steps, brake = _MOTION_COMMANDS[command]
+    _play_prompt(prompt, safety)
+    _update_ui_face("moving")
+    # LED animates in the background for the whole move instead of
+    # blocking before and after it
+    led = _start_face_led("normal")
+    try:
+        for method, *args in steps:
+            getattr(driver, method)(*args)
         if safety:
             safety.heartbeat()
+        if brake is None:
+            # Send heartbeats continuously during movement
+            _safe_sleep(_MOTION_DURATION_S, safety)
+            driver.brake()
+        else:
+            # Continuous distance monitoring with ultrasonic brake
+            _drive_with_ultrasonic_brake(driver, command, *brake, safety)
         _update_ui_face("normal_smile")
-        _show_face_led("normal", duration=0.2, safety=safety)
-        # Play positive feedback
-        _play_prompt("bc_10_demo_positive.wav", safety)
-    
-    elif command == "stop":
-        # Play stop demo prompt
-        _play_prompt("bc_09_demo_stop.wav", safety)
-        _update_ui_face("stop")
-        driver.brake()
-        if safety:
-            safety.heartbeat()
-        # Hold state for 5 seconds
+    finally:
+        # Don't leave the animation running (and LED jobs queued) on errors
+        _stop_face_led(led)
+    # Play positive feedback
+    _play_prompt("bc_10_demo_positive.wav", safety)
+
+
+def _do_stop(driver, command: str, safety: Optional[SafetyManager]) -> None:
+    """Stop: brake and hold for 5 seconds."""
+    # Play stop demo prompt
+    _play_prompt("bc_09_demo_stop.wav", safety)
+    _update_ui_face("stop")
+    driver.brake()
+    if safety:
+        safety.heartbeat()
+    # Hold state for 5 seconds; the LED face animates during the hold
+    # instead of adding its own second afterwards
+    led = _start_face_led("normal")
+    try:
         _safe_sleep(5.0, safety)
-        _show_face_led("normal", duration=1.0, safety=safety)
         _update_ui_face("normal_smile")
-        # Play positive feedback
-        _play_prompt("bc_10_demo_positive.wav", safety)
+    finally:
+        _stop_face_led(led)
+    # Play positive feedback
+    _play_prompt("bc_10_demo_positive.wav", safety)
+
+
+# command -> handler(driver, command, safety)
+_COMMAND_HANDLERS = {
+    "greeting": _do_greeting,
+    "stop": _do_stop,
+    **{name: _do_motion for name in _MOTION_COMMANDS},
+}
+
+
+def _perform_safe_command(command: str, safety: Optional[SafetyManager], driver=None) -> None:
+    """
+    Perform a safe robot command.
+    Commands: greeting, forward, backward, turn_left, turn_right, stop
+    Dispatched through _COMMAND_HANDLERS; movement commands share _do_motion.
+    ``driver`` is the session's MotorDriver; defaults to the motors singleton.
+    """
+    LOGGER.info("Command demonstrated: %s", command)
 
+    handler = _COMMAND_HANDLERS.get(command)
+    if handler is None:
+        LOGGER.warning("Unknown command: %s", command)
+        return
 
-def _perform_360_rotation(safety: Optional[SafetyManager]) -> bool:
+    # Ensure motors are in a safe stopped state before every command
+    motors.reset_to_safe()
+
+    handler(_resolve_driver(driver), command, safety)
+
+
+def _perform_360_rotation(safety: Optional[SafetyManager], driver=None) -> bool:
     """
     Perform 360 degree rotation, stopping if face becomes visible.
     Returns True if face becomes visible, False otherwise.
     """
-    driver = motors._get_driver() if hasattr(motors, '_get_driver') else motors.MotorDriver()
+    driver = _resolve_driver(driver)
     
     LOGGER.info("Starting 360 degree rotation to find face")
     _update_ui_face("moving")
@@ -463,8 +638,8 @@ def _perform_360_rotation(safety: Optional[SafetyManager]) -> bool:
         safety.heartbeat()
 
     # Rotate and check for face continuously
-    start_time = time.time()
-    last_face_check = 0
+    start_time = time.monotonic()
+    last_face_check = float("-inf")
     rotation_duration = 3.15  # Calibrated: exactly one 360-degree rotation at 100% speed
     motor_braked = False
 
@@ -472,24 +647,25 @@ def _perform_360_rotation(safety: Optional[SafetyManager]) -> bool:
         if safety:
             safety.heartbeat()
 
-        elapsed = time.time() - start_time
+        now = time.monotonic()
+        elapsed = now - start_time
 
         # Brake motor at exactly 3.15s — BEFORE face detection which can take ~3s
-        if not motor_braked and elapsed >= rotation_duration:
+        # (or right away if a stop was requested)
+        if not motor_braked and (elapsed >= rotation_duration or _stop_event.is_set()):
             driver.brake()
             motor_braked = True
             LOGGER.info("360 rotation complete (%.2fs), motor braked", elapsed)
             break
 
         # Check for face every 0.5 seconds while still rotating
-        current_time = time.time()
-        if current_time - last_face_check >= 0.5:
+        if now - last_face_check >= 0.5:
             if _detect_face_binary("during_360_rotation", safety):
                 LOGGER.info("Face visible during 360 rotation: True")
                 driver.brake()
                 _update_ui_face("normal_smile")
                 return True
-            last_face_check = time.time()  # update after detection (detection takes time)
+            last_face_check = time.monotonic()  # update after detection (detection takes time)
 
         _safe_sleep(0.05, safety)
 
@@ -498,8 +674,7 @@ def _perform_360_rotation(safety: Optional[SafetyManager]) -> bool:
         safety.heartbeat()
     
     # Final face check after rotation
-    _safe_sleep(0.5, safety)
-    face_visible = _detect_face_binary("after_360_rotation", safety)
+    face_visible = _wait_for_face("after_360_rotation", 0.5, safety)
     LOGGER.info("Face visible after 360 rotation: %s", face_visible)
     _update_ui_face("normal_smile")
     
@@ -509,10 +684,18 @@ def _perform_360_rotation(safety: Optional[SafetyManager]) -> bool:
 class BasicCommandsModule(BaseModule):
     """Module 10: Basic Commands & Robot Interaction - Finalized for POC."""
 
-    def __init__(self) -> None:
+    def __init__(self, safety: Optional[SafetyManager] = None) -> None:
         super().__init__("basic_commands")
-        self.safety: Optional[SafetyManager] = None
+        # Share the module-level event so helper sleeps see stop requests
+        self._stop_event = _stop_event
+        self.safety: Optional[SafetyManager] = safety
+        # True only for the fallback manager created in enter(); an injected
+        # manager belongs to the caller, which starts and stops it
+        self._owns_safety = False
+        # Motor driver for this session, resolved once in enter()
+        self.driver = None
         self.reposition_attempted = False
+        self._plan: list = []
     
     def set_safety_manager(self, safety_manager: SafetyManager) -> None:
         """Set the SafetyManager instance from orchestrator."""
@@ -522,21 +705,35 @@ class BasicCommandsModule(BaseModule):
         """Initialize basic commands and robot interaction."""
         self.logger.info("Module start: basic_commands")
         self.reposition_attempted = False
+        if not self._stop_requested:
+            self._stop_event.clear()
 
         # Free all motor pins from any previous session before doing anything
         motors.reset_to_safe()
+        self.driver = _resolve_driver()
 
         # Safety manager should be set by orchestrator before enter() is called
         # If not set, create a fallback (shouldn't happen in normal flow)
         if self.safety is None:
             self.logger.warning("SafetyManager not provided by orchestrator, creating fallback")
             try:
-                from control.safety import SafetyManager
                 self.safety = SafetyManager()
                 self.safety.start()
+                self._owns_safety = True
             except Exception:
                 self.safety = None
+        else:
+            self.safety.heartbeat()
         
+        # Build the demonstration plan up front so run() is a straight walk:
+        # greeting first, then the session intro, then every movement command
+        self._plan = [("command", "greeting"), ("prompt", "bc_02_session_intro.wav")]
+        self._plan += [("command", cmd) for cmd in _DEMO_COMMANDS]
+
+        # Load the face detector in the background during the pre-greeting
+        # wait, so the first real check doesn't pay the model load
+        _get_executor("face").submit(face_detector.warm_up)
+
         # Wait 5 seconds before starting greeting
         _safe_sleep(5.0, self.safety)
 
@@ -548,24 +745,16 @@ class BasicCommandsModule(BaseModule):
             self._set_running(False)
             return ModuleResult(completed=False, engagement=None)
         
-        # Step 1: Always start with greeting command (first prompt)
-        self.logger.info("Demonstrating commands: greeting (always first)")
-        _perform_safe_command("greeting", self.safety)
-        
-        # Step 2: Play session intro prompt (second prompt)
-        _play_prompt("bc_02_session_intro.wav", self.safety)
-        
-        # Step 3: Run all movement commands in fixed order (excluding greeting)
-        selected_commands = ["forward", "backward", "turn_left", "turn_right", "stop"]
-
-        self.logger.info("Demonstrating all commands: %s", selected_commands)
-
-        # Step 4: Demonstrate all commands
-        for i, cmd in enumerate(selected_commands):
+        # Steps 1-4: greeting, session intro, then all commands (plan from enter())
+        self.logger.info("Demonstrating commands: %s",
+                         [arg for kind, arg in self._plan if kind == "command"])
+        for kind, arg in self._plan:
             if self._stop_requested:
                 break
-            
-            _perform_safe_command(cmd, self.safety)
+            if kind == "prompt":
+                _play_prompt(arg, self.safety)
+            else:
+                _perform_safe_command(arg, self.safety, self.driver)
         
         # Step 5: Face detection logic after all commands
         # Initial face observation
@@ -580,7 +769,7 @@ class BasicCommandsModule(BaseModule):
             _play_prompt("bc_12_reposition_start.wav", self.safety)
             
             # Perform 360 degree rotation, stopping if face becomes visible
-            face_visible_after = _perform_360_rotation(self.safety)
+            face_visible_after = _perform_360_rotation(self.safety, self.driver)
             
             # Play reposition done prompt
             _play_prompt("bc_13_reposition_done.wav", self.safety)
@@ -593,13 +782,8 @@ class BasicCommandsModule(BaseModule):
         # Observe for 2 seconds after face detection/rotation
         # Play observation waiting prompt
         _play_prompt("bc_11_observe_waiting.wav", self.safety)
-        # Send heartbeats during observation (safe_sleep handles this)
-        if self.safety:
-            self.safety.heartbeat()
-        _safe_sleep(2.0, self.safety)
-        if self.safety:
-            self.safety.heartbeat()
-        face_during = _detect_face_binary("after_all_commands", self.safety)
+        # The camera check runs during the window; a visible face ends it early
+        face_during = _observe_face("after_all_commands", 2.0, self.safety)
         # Log observation (binary only, no interpretation)
         self.logger.debug("Face visible after all commands: %s", face_during)
         
@@ -610,9 +794,6 @@ class BasicCommandsModule(BaseModule):
         _update_ui_face("normal_smile")
         _show_face_led("normal", duration=1.0, safety=self.safety)
         
-        if self.safety:
-            self.safety.heartbeat()
-        
         self._set_running(False)
         return ModuleResult(completed=True, engagement=None)
 
@@ -626,8 +807,13 @@ class BasicCommandsModule(BaseModule):
         # Final safe state + full GPIO release so next session starts clean
         motors.reset_to_safe()
         motors.cleanup()
+        self.driver = None
+        _shutdown_executors()
         hcsr04_back.cleanup()
 
-        if self.safety:
+        # Only stop the watchdog we started; a shared one keeps running
+        if self.safety and self._owns_safety:
             self.safety.stop()
+            self.safety = None
+            self._owns_safety = False
         
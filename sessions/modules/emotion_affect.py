@@ -1,28 +1,10 @@
 """Emotion & Affect Recognition module."""
 from __future__ import annotations
 
-from sessions.modules.base import BaseModule, ModuleResult
+from sessions.modules._noop import NoopModule
 
 
-class EmotionAffectModule(BaseModule):
+class EmotionAffectModule(NoopModule):
     """Module 3: Emotion & Affect Recognition - Thin adapter."""
 
-    def __init__(self) -> None:
-        super().__init__("emotion_affect")
-
-    def enter(self) -> None:
-        """Initialize emotion and affect recognition."""
-        self.logger.info("Module start: emotion_affect")
-
-    def run(self) -> ModuleResult:
-        """Run emotion and affect recognition - thin adapter."""
-        self._set_running(True)
-        if self._stop_requested:
-            self._set_running(False)
-            return ModuleResult(completed=False, engagement=None)
-        self._set_running(False)
-        return ModuleResult(completed=True, engagement=None)
-
-    def exit(self) -> None:
-        """Cleanup emotion and affect recognition."""
-        self.logger.info("Module end: emotion_affect")
+    MODULE_NAME = "emotion_affect"
@@ -1,38 +1,15 @@
 """Object Identification module."""
 from __future__ import annotations
 
-from sessions.modules.base import BaseModule, ModuleResult
+from sessions.modules._noop import NoopModule
 
 
-class ObjectIdentificationModule(BaseModule):
-    """Module 1: Object Identification - Thin adapter."""
+class ObjectIdentificationModule(NoopModule):
+    """
+    Module 1: Object Identification - Thin adapter.
 
-    def __init__(self) -> None:
-        super().__init__("object_identification")
-
-    def enter(self) -> None:
-        """Initialize object identification."""
-        self.logger.info("Module start: object_identification")
-
-    def run(self) -> ModuleResult:
-        """Run object identification - thin adapter to existing code."""
-        self._set_running(True)
-        
-        # Thin adapter: call existing working code
-        # For POC: minimal implementation returns result
-        # TODO: Call existing object identification flow when available
-        
-        if self._stop_requested:
-            self._set_running(False)
-            return ModuleResult(completed=False, engagement=None)
-        
-        # Placeholder: existing code would be called here
-        # Example: run_existing_object_identification_flow()
-        
-        self._set_running(False)
-        return ModuleResult(completed=True, engagement=None)
-
-    def exit(self) -> None:
-        """Cleanup object identification."""
-        self.logger.info("Module end: object_identification")
+    Note: runs as a no-op until the existing object identification flow is
+    available to call from here.
+    """
 
+    MODULE_NAME = "object_identification"
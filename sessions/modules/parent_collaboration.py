@@ -1,28 +1,10 @@
 """Parent & Therapist Collaboration module."""
 from __future__ import annotations
 
-from sessions.modules.base import BaseModule, ModuleResult
+from sessions.modules._noop import NoopModule
 
 
-class ParentCollaborationModule(BaseModule):
+class ParentCollaborationModule(NoopModule):
     """Module 9: Parent & Therapist Collaboration - Thin adapter."""
 
-    def __init__(self) -> None:
-        super().__init__("parent_collaboration")
-
-    def enter(self) -> None:
-        """Initialize parent and therapist collaboration."""
-        self.logger.info("Module start: parent_collaboration")
-
-    def run(self) -> ModuleResult:
-        """Run parent and therapist collaboration - thin adapter."""
-        self._set_running(True)
-        if self._stop_requested:
-            self._set_running(False)
-            return ModuleResult(completed=False, engagement=None)
-        self._set_running(False)
-        return ModuleResult(completed=True, engagement=None)
-
-    def exit(self) -> None:
-        """Cleanup parent and therapist collaboration."""
-        self.logger.info("Module end: parent_collaboration")
+    MODULE_NAME = "parent_collaboration"
@@ -1,8 +1,9 @@
 """Tokymon 5.2-inch touchscreen face server.
 
 Serves a neon SVG face designed for autistic children via a threaded HTTP
-server.  Server-Sent Events (SSE) replace the original 200 ms client poll so
-expression changes reach the display in under 15 ms.
+server.  Server-Sent Events (SSE) replace the original 200 ms client poll;
+stream handlers sleep on a condition until set_face_mode() publishes a change,
+so expression changes reach the display at once and idle streams cost nothing.
 
 Expression → face_mode mapping (set by basic_commands.py, unchanged):
     waiting      → calm neutral, slow pupil drift, auto-blink  (boot / idle)
@@ -12,30 +13,73 @@ Expression → face_mode mapping (set by basic_commands.py, unchanged):
     moving       → excited squint eyes, very wide smile
     stop         → thinking face, pupils up, pulsing dots
 
-Public API is unchanged: start_ui_server(port), stop_ui_server()
+Public API: start_ui_server(port), stop_ui_server(), set_face_mode(mode)
 """
 from __future__ import annotations
 
 import json
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from socketserver import ThreadingMixIn
-from typing import Any, Dict, Optional
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from system.logger import get_logger
 
-LOGGER = get_logger("ui_server")
-
 try:
-    from sessions.modules.basic_commands import _ui_state, _ui_lock
+    import orjson
+
+    def _json_bytes(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes (orjson: no str round-trip)."""
+        return orjson.dumps(obj)
 except ImportError:
-    _ui_state: Dict[str, Any] = {"face_mode": "waiting", "last_update": time.time()}
-    _ui_lock = threading.Lock()
+    def _json_bytes(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes (stdlib fallback)."""
+        return json.dumps(obj).encode()
+
+LOGGER = get_logger("ui_server")
 
 
-class _ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
-    """Each connection (including long-lived SSE streams) gets its own thread."""
+def _encode_state(state: Dict[str, Any]) -> Tuple[bytes, str]:
+    """Serialize a state snapshot once and derive its ETag."""
+    body = _json_bytes(state)
+    return body, '"%08x"' % zlib.adler32(body)
+
+
+# Current face state, published as an immutable snapshot: set_face_mode()
+# builds a new dict and rebinds _ui_state under _ui_lock, and nothing mutates
+# a published dict. Readers grab the reference (atomic under the GIL) and use
+# it without the lock or a copy.
+_ui_state: Dict[str, Any] = {"face_mode": "waiting", "last_update": time.time()}
+# (JSON body, ETag) of _ui_state, rebuilt only when the state is published
+_ui_payload: Tuple[bytes, str] = _encode_state(_ui_state)
+_ui_lock = threading.Lock()
+# Notified (by set_face_mode) whenever _ui_state changes; SSE streams wait on it
+_ui_changed = threading.Condition(_ui_lock)
+# Idle SSE streams send a comment this often so dead clients are noticed
+_SSE_KEEPALIVE_S = 15.0
+
+
+def set_face_mode(mode: str) -> None:
+    """Publish a new face_mode and wake every open SSE stream."""
+    global _ui_state, _ui_payload
+    state = {"face_mode": mode, "last_update": time.time()}
+    payload = _encode_state(state)
+    with _ui_changed:
+        _ui_state = state
+        _ui_payload = payload
+        _ui_changed.notify_all()
+
+
+class _ThreadedHTTPServer(ThreadingHTTPServer):
+    """Each connection (including long-lived SSE streams) gets its own thread.
+
+    With one kiosk browser and the odd phone there are only a few
+    connections, and idle SSE threads sleep on _ui_changed; their stacks are
+    virtual reservations, so the resident cost per thread is small.
+    HTTPServer already sets allow_reuse_address, so a restart can rebind the
+    port while the previous socket is in TIME_WAIT.
+    """
     daemon_threads = True
 
 
@@ -342,6 +386,7 @@ scheduleBlink();
 // ── SSE connection with polling fallback ───────────────────────────────────
 // Primary: EventSource at /api/events — server pushes on every state change.
 // Fallback: setInterval poll at 200 ms (same as original) if SSE drops.
+// applyMode() skips the DOM work when the mode has not changed.
 var lastMode = null;
 var pollTimer = null;
 
@@ -352,6 +397,22 @@ function applyMode(mode) {
   }
 }
 
+// Fallback poll: at most one request in flight, abandoned after 150 ms so
+// slow responses never pile up. cache:'no-cache' revalidates with the ETag,
+// so an unchanged face comes back as a bodyless 304 from the server.
+var polling = false;
+function pollState() {
+  if (polling) return;
+  polling = true;
+  var ac = new AbortController();
+  var t = setTimeout(function() { ac.abort(); }, 150);
+  fetch('/api/state', {signal: ac.signal, cache: 'no-cache'})
+    .then(function(r) { return r.json(); })
+    .then(function(d) { applyMode(d.face_mode); })
+    .catch(function() {})
+    .then(function() { clearTimeout(t); polling = false; });
+}
+
 function connectSSE() {
   var es = new EventSource('/api/events');
   es.onmessage = function(ev) {
@@ -360,12 +421,7 @@ function connectSSE() {
   es.onerror = function() {
     es.close();
     if (!pollTimer) {
-      pollTimer = setInterval(function() {
-        fetch('/api/state')
-          .then(function(r) { return r.json(); })
-          .then(function(d) { applyMode(d.face_mode); })
-          .catch(function() {});
-      }, 200);
+      pollTimer = setInterval(pollState, 200);
     }
   };
 }
@@ -378,6 +434,10 @@ apply('waiting');
 </body>
 </html>"""
 
+# Encoded once; the page is fully static so every GET just writes these.
+_HTML_BYTES = _HTML.encode("utf-8")
+_HTML_LEN = str(len(_HTML_BYTES))
+
 
 # ---------------------------------------------------------------------------
 # HTTP request handler
@@ -386,33 +446,46 @@ apply('waiting');
 class UIRequestHandler(BaseHTTPRequestHandler):
     """Handles HTML, JSON state, and SSE stream requests."""
 
+    # Keep-alive: fallback polls reuse one socket instead of a TCP handshake
+    # each time. Every non-streaming response therefore sets Content-Length.
+    protocol_version = "HTTP/1.1"
+    # Drop keep-alive connections idle this long so they don't pin a server
+    # thread forever; SSE streams write a keepalive every _SSE_KEEPALIVE_S
+    timeout = 60
+
     def do_GET(self) -> None:
-        if self.path in ("/", "/index.html"):
-            self._serve_html()
-        elif self.path == "/api/state":
-            self._serve_state()
-        elif self.path == "/api/events":
-            self._serve_sse()
+        handler = _ROUTES.get(self.path)
+        if handler is not None:
+            handler(self)
         else:
             self.send_error(404)
 
     def _serve_html(self) -> None:
-        body = _HTML.encode("utf-8")
         self.send_response(200)
         self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Content-Length", _HTML_LEN)
+        self.send_header("Cache-Control", "public, max-age=3600")
         self.end_headers()
-        self.wfile.write(body)
+        self.wfile.write(_HTML_BYTES)
 
     def _serve_state(self) -> None:
-        """JSON snapshot — used as SSE fallback and initial-load check."""
-        with _ui_lock:
-            state = _ui_state.copy()
-        body = json.dumps(state).encode()
+        """JSON snapshot — used as SSE fallback and initial-load check.
+
+        The body is serialized once per state change; a client revalidating
+        with the current ETag gets a bodyless 304.
+        """
+        body, etag = _ui_payload
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            return
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Cache-Control", "no-cache")
+        self.send_header("ETag", etag)
         self.send_header("Content-Length", str(len(body)))
         self.end_headers()
         self.wfile.write(body)
@@ -420,39 +493,41 @@ class UIRequestHandler(BaseHTTPRequestHandler):
     def _serve_sse(self) -> None:
         """Hold the connection open and push face_mode changes as SSE events.
 
-        Polls _ui_state every 10 ms server-side.  Only writes to the socket
-        when the mode actually changes, so there is no bandwidth waste and
-        the browser reacts in under 15 ms end-to-end.
+        Sleeps on _ui_changed between updates and only writes to the socket
+        when the mode actually changes (plus a keepalive comment when idle),
+        so a static face costs no CPU or bandwidth.
         """
         self.send_response(200)
         self.send_header("Content-Type", "text/event-stream")
         self.send_header("Cache-Control", "no-cache")
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("X-Accel-Buffering", "no")  # disable nginx buffering
+        # No Content-Length: the stream ends when the socket closes
+        self.send_header("Connection", "close")
         self.end_headers()
 
         last_mode: Optional[str] = None
         try:
             # Push current state immediately on connect so the face appears
             # at once rather than waiting for the first change.
-            with _ui_lock:
-                mode = _ui_state.get("face_mode", "waiting")
-            self.wfile.write(
-                ("data: " + json.dumps({"face_mode": mode}) + "\n\n").encode()
-            )
+            mode = _ui_state.get("face_mode", "waiting")
+            self.wfile.write(b"data: " + _json_bytes({"face_mode": mode}) + b"\n\n")
             self.wfile.flush()
             last_mode = mode
 
             while True:
-                with _ui_lock:
+                with _ui_changed:
+                    _ui_changed.wait_for(
+                        lambda: _ui_state.get("face_mode", "waiting") != last_mode,
+                        timeout=_SSE_KEEPALIVE_S,
+                    )
                     mode = _ui_state.get("face_mode", "waiting")
                 if mode != last_mode:
-                    self.wfile.write(
-                        ("data: " + json.dumps({"face_mode": mode}) + "\n\n").encode()
-                    )
-                    self.wfile.flush()
+                    self.wfile.write(b"data: " + _json_bytes({"face_mode": mode}) + b"\n\n")
                     last_mode = mode
-                time.sleep(0.01)   # 10 ms poll — imperceptible latency
+                else:
+                    self.wfile.write(b": keepalive\n\n")
+                self.wfile.flush()
 
         except (BrokenPipeError, ConnectionResetError, OSError):
             pass  # browser closed the tab / navigated away — normal exit
@@ -461,6 +536,15 @@ class UIRequestHandler(BaseHTTPRequestHandler):
         pass  # suppress per-request access logs
 
 
+# Path -> handler method for do_GET
+_ROUTES: Dict[str, Callable[[UIRequestHandler], None]] = {
+    "/": UIRequestHandler._serve_html,
+    "/index.html": UIRequestHandler._serve_html,
+    "/api/state": UIRequestHandler._serve_state,
+    "/api/events": UIRequestHandler._serve_sse,
+}
+
+
 # ---------------------------------------------------------------------------
 # Server lifecycle  (public API unchanged)
 # ---------------------------------------------------------------------------
@@ -4,7 +4,7 @@ from __future__ import annotations
 import time
 import uuid
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from control.safety import SafetyManager
 from sessions.modules import MODULE_REGISTRY
@@ -13,6 +13,10 @@ from system.logger import get_logger
 
 LOGGER = get_logger("orchestrator")
 
+# Registry names in order (default selection) and as a set (validation)
+_DEFAULT_MODULE_NAMES: Tuple[str, ...] = tuple(name for name, _ in MODULE_REGISTRY)
+_MODULE_NAMES: frozenset = frozenset(_DEFAULT_MODULE_NAMES)
+
 
 class SessionState(Enum):
     """
@@ -69,6 +73,15 @@ class SessionState(Enum):
     SAFE_SHUTDOWN = "safe_shutdown"
 
 
+class ExecRecord(NamedTuple):
+    """One execution log entry (simplified schema)."""
+
+    module_name: str
+    start_time: float
+    end_time: float
+    completed: bool
+
+
 class SessionOrchestrator:
     """
     Session Orchestrator using a Finite State Machine.
@@ -101,6 +114,8 @@ class SessionOrchestrator:
         # Session tracking
         self.session_id: Optional[str] = None
         self.session_start_time: Optional[float] = None
+        # Monotonic deadline for the session duration limit (set in start_session)
+        self._session_deadline: Optional[float] = None
         self.modules_completed: List[str] = []
         self.current_module: Optional[BaseModule] = None
         self.current_module_name: Optional[str] = None
@@ -115,7 +130,21 @@ class SessionOrchestrator:
         self._initialize_modules()
 
         # Execution log (simplified)
-        self.execution_log: List[Dict[str, Any]] = []
+        self.execution_log: List[ExecRecord] = []
+        # (key, (modules_run, execution_log)) tuples reused by run() until the
+        # log grows; see _get_session_results()
+        self._results_views: Optional[Tuple[tuple, Tuple[tuple, tuple]]] = None
+
+        # FSM dispatch: state -> handler. IDLE and SESSION_END have no handler.
+        self._dispatch: Dict[SessionState, Callable[[], None]] = {
+            SessionState.SESSION_START: self._handle_session_start,
+            SessionState.GREETING: self._handle_greeting,
+            SessionState.MODULE_SELECT: self._handle_module_select,
+            SessionState.MODULE_RUNNING: self._handle_module_running,
+            SessionState.MODULE_COMPLETE: self._handle_module_complete,
+            SessionState.EMERGENCY_STOP: self._handle_emergency_stop,
+            SessionState.SAFE_SHUTDOWN: self._handle_safe_shutdown,
+        }
 
     def _initialize_modules(self) -> None:
         """Initialize all module instances."""
@@ -141,6 +170,7 @@ class SessionOrchestrator:
 
         self.session_id = str(uuid.uuid4())
         self.session_start_time = time.time()
+        self._session_deadline = time.monotonic() + self.max_session_duration_seconds
         self.modules_completed = []
         self.execution_log = []
         self._stop_requested = False
@@ -148,17 +178,14 @@ class SessionOrchestrator:
         # Select modules
         if selected_modules is None:
             # Default: first N modules
-            selected_modules = [
-                name for name, _ in MODULE_REGISTRY[: self.max_modules_per_session]
-            ]
+            selected_modules = list(_DEFAULT_MODULE_NAMES[: self.max_modules_per_session])
         else:
             # Validate and enforce max 3 modules
             if len(selected_modules) > 3:
                 self.logger.warning("More than 3 modules requested, limiting to 3")
                 selected_modules = selected_modules[:3]
             # Validate module names
-            available = {name for name, _ in MODULE_REGISTRY}
-            invalid = set(selected_modules) - available
+            invalid = set(selected_modules).difference(_MODULE_NAMES)
             if invalid:
                 raise ValueError(f"Invalid module names: {invalid}")
 
@@ -183,8 +210,8 @@ class SessionOrchestrator:
             Dict with session results:
             - session_id: str
             - completed: bool
-            - modules_run: List[str]
-            - execution_log: List[Dict]
+            - modules_run: Tuple[str, ...]
+            - execution_log: Tuple[ExecRecord, ...]
         """
         if self.state == SessionState.IDLE:
             self.logger.warning("Session not started. Call start_session() first.")
@@ -196,32 +223,16 @@ class SessionOrchestrator:
             return self._get_session_results()
         
         # Check session duration limit
-        if self.session_start_time:
-            elapsed = time.time() - self.session_start_time
-            if elapsed > self.max_session_duration_seconds:
-                self.logger.warning("Session duration limit exceeded (15 min), ending session")
-                self._stop_requested = True
-                self._handle_emergency_stop()
-                return self._get_session_results()
-
-        # FSM state machine
-        if self.state == SessionState.SESSION_START:
-            self._handle_session_start()
-        elif self.state == SessionState.GREETING:
-            self._handle_greeting()
-        elif self.state == SessionState.MODULE_SELECT:
-            self._handle_module_select()
-        elif self.state == SessionState.MODULE_RUNNING:
-            self._handle_module_running()
-        elif self.state == SessionState.MODULE_COMPLETE:
-            self._handle_module_complete()
-        elif self.state == SessionState.EMERGENCY_STOP:
+        if self._session_deadline is not None and time.monotonic() > self._session_deadline:
+            self.logger.warning("Session duration limit exceeded (15 min), ending session")
+            self._stop_requested = True
             self._handle_emergency_stop()
-        elif self.state == SessionState.SAFE_SHUTDOWN:
-            self._handle_safe_shutdown()
-        elif self.state == SessionState.SESSION_END:
-            # Session already ended
-            pass
+            return self._get_session_results()
+
+        # FSM state machine (SESSION_END: session already ended, no-op)
+        handler = self._dispatch.get(self.state)
+        if handler is not None:
+            handler()
 
         return self._get_session_results()
 
@@ -317,14 +328,12 @@ class SessionOrchestrator:
             self.current_module.exit()
 
             # Log execution (simplified schema)
-            execution_time = time.time() - self.module_start_time
-            log_entry = {
-                "module_name": self.current_module_name,
-                "start_time": self.module_start_time,
-                "end_time": time.time(),
-                "completed": module_result.completed,
-            }
-            self.execution_log.append(log_entry)
+            self.execution_log.append(ExecRecord(
+                self.current_module_name,
+                self.module_start_time,
+                time.time(),
+                module_result.completed,
+            ))
             self.logger.info(
                 "Module %s completed: %s",
                 self.current_module_name,
@@ -341,13 +350,10 @@ class SessionOrchestrator:
         except Exception as exc:
             self.logger.exception("Error running module %s: %s", self.current_module_name, exc)
             # Log failed execution (simplified)
-            log_entry = {
-                "module_name": self.current_module_name,
-                "start_time": self.module_start_time or time.time(),
-                "end_time": time.time(),
-                "completed": False,
-            }
-            self.execution_log.append(log_entry)
+            now = time.time()
+            self.execution_log.append(ExecRecord(
+                self.current_module_name, self.module_start_time or now, now, False
+            ))
             self._transition_to(SessionState.EMERGENCY_STOP)
 
         finally:
@@ -380,13 +386,9 @@ class SessionOrchestrator:
 
         # Log emergency stop (simplified)
         if self.current_module_name and self.module_start_time:
-            log_entry = {
-                "module_name": self.current_module_name,
-                "start_time": self.module_start_time,
-                "end_time": time.time(),
-                "completed": False,
-            }
-            self.execution_log.append(log_entry)
+            self.execution_log.append(ExecRecord(
+                self.current_module_name, self.module_start_time, time.time(), False
+            ))
 
         self._transition_to(SessionState.SAFE_SHUTDOWN)
 
@@ -400,14 +402,27 @@ class SessionOrchestrator:
 
         self._transition_to(SessionState.SESSION_END)
 
-    def get_session_results(self) -> Dict[str, Any]:
-        """Get current session results."""
+    def get_session_results(self, copy: bool = False) -> Dict[str, Any]:
+        """
+        Get current session results.
+
+        Same shape as run(): modules_run and execution_log are tuples, which
+        callers cannot append to, and log entries are ExecRecord named tuples
+        (use record._asdict() to serialize one). Pass copy=True to get lists
+        instead.
+        """
+        if copy:
+            return self._build_results(list(self.modules_completed), list(self.execution_log))
+        return self._build_results(tuple(self.modules_completed), tuple(self.execution_log))
+
+    def _build_results(self, modules_run: Any, execution_log: Any) -> Dict[str, Any]:
+        """Assemble the results payload around the given module/log views."""
         return {
             "session_id": self.session_id,
             "state": self.state.value,
             "completed": self.state == SessionState.SESSION_END,
-            "modules_run": self.modules_completed.copy(),
-            "execution_log": self.execution_log.copy(),
+            "modules_run": modules_run,
+            "execution_log": execution_log,
             "session_duration": (
                 time.time() - self.session_start_time
                 if self.session_start_time
@@ -416,8 +431,17 @@ class SessionOrchestrator:
         }
 
     def _get_session_results(self) -> Dict[str, Any]:
-        """Internal alias for get_session_results()."""
-        return self.get_session_results()
+        """
+        Results returned by run(): a fresh dict every tick, but the
+        modules_run/execution_log tuples are only rebuilt when they grow.
+        """
+        key = (self.session_id, len(self.modules_completed), len(self.execution_log))
+        if self._results_views is None or self._results_views[0] != key:
+            self._results_views = (
+                key,
+                (tuple(self.modules_completed), tuple(self.execution_log)),
+            )
+        return self._build_results(*self._results_views[1])
 
     def is_session_active(self) -> bool:
         """Check if session is currently active."""
@@ -1,13 +1,21 @@
 """Centralized configuration loader for Tokymon."""
 from __future__ import annotations
 
+import functools
 import os
+from collections.abc import MutableMapping
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 import yaml
 from dotenv import load_dotenv
 
+# libyaml's C loader when PyYAML was built with it; same safe semantics
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
 BASE_DIR = Path(__file__).resolve().parents[1]
 CONFIGS_DIR = BASE_DIR / "configs"
 MAC_ROOT = Path("/Users/ankursharma/Documents/Dev Projects/tokymon")
@@ -31,7 +39,7 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Config file missing: {path}")
     with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+        return yaml.load(handle, Loader=_YAMLLoader) or {}
 
 
 def _load_env_files() -> None:
@@ -90,4 +98,34 @@ def _build_config() -> Dict[str, Any]:
     return config
 
 
-CONFIG = _build_config()
+# Parsed once per process: Supervisor restarts worker *threads*, which share
+# this cache, so there is no cross-process reparse worth caching on disk.
+@functools.lru_cache(maxsize=1)
+def get_config() -> Dict[str, Any]:
+    """Build the configuration on first use and return the same dict afterwards."""
+    return _build_config()
+
+
+class _LazyConfig(MutableMapping):
+    """Dict-like view of get_config(); nothing is parsed until first access."""
+
+    def __getitem__(self, key: str) -> Any:
+        return get_config()[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        get_config()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del get_config()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(get_config())
+
+    def __len__(self) -> int:
+        return len(get_config())
+
+    def __repr__(self) -> str:
+        return repr(get_config())
+
+
+CONFIG = _LazyConfig()
@@ -1,9 +1,44 @@
-"""Shared logging configuration."""
+"""Shared logging configuration.
+
+Logs are human-readable by default. Set TOKY_LOG_FORMAT=json for one JSON
+object per line (serialized with orjson when installed) for log tooling.
+"""
+import json
 import logging
+import os
 from logging import Logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 _LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-logging.basicConfig(level=logging.INFO, format=_LOG_FORMAT)
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        if orjson is not None:
+            return orjson.dumps(entry).decode()
+        return json.dumps(entry)
+
+
+if os.getenv("TOKY_LOG_FORMAT", "").lower() == "json":
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(JsonFormatter())
+    logging.basicConfig(level=logging.INFO, handlers=[_handler])
+else:
+    logging.basicConfig(level=logging.INFO, format=_LOG_FORMAT)
 
 
 def get_logger(name: str) -> Logger:
@@ -1,8 +1,8 @@
 """MQTT event bus wrapper."""
 from __future__ import annotations
 
+import queue
 import threading
-from dataclasses import dataclass
 from typing import Callable, Dict, Protocol
 
 from system.config import CONFIG
@@ -10,6 +10,9 @@ from system.logger import get_logger
 
 LOGGER = get_logger("mqtt")
 
+# Queued after the last publish to end the flusher thread
+_TX_STOP = object()
+
 
 class _ClientProtocol(Protocol):
     def connect(self, host: str, port: int, keepalive: int) -> int: ...
@@ -21,10 +24,12 @@ class _ClientProtocol(Protocol):
     on_message: Callable[..., None]
 
 
-@dataclass
 class _MockClient:
-    on_connect: Callable[..., None] = lambda *args, **kwargs: None
-    on_message: Callable[..., None] = lambda *args, **kwargs: None
+    __slots__ = ("on_connect", "on_message")
+
+    def __init__(self) -> None:
+        self.on_connect: Callable[..., None] = lambda *args, **kwargs: None
+        self.on_message: Callable[..., None] = lambda *args, **kwargs: None
 
     def connect(self, host: str, port: int, keepalive: int) -> int:  # pragma: no cover - simple mock
         LOGGER.info("Mock MQTT connect %s:%s", host, port)
@@ -61,6 +66,15 @@ class MqttBus:
         self._client.on_connect = self._on_connect
         self._callbacks: Dict[str, Callable[[str], None]] = {}
         self._thread: threading.Thread | None = None
+        # Outgoing (topic, payload) pairs, drained in bursts by one flusher
+        # thread so callers never block on paho's internal lock
+        self._tx_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._tx_thread: threading.Thread | None = None
+        # True while the flusher accepts messages; guarded by _tx_lock so no
+        # publish can be queued behind _TX_STOP
+        self._tx_open = False
+        self._tx_lock = threading.Lock()
+        self._stopped = False
         self._host = host
         self._port = port
 
@@ -70,11 +84,40 @@ class MqttBus:
         if not isinstance(self._client, _MockClient):
             self._thread = threading.Thread(target=self._client.loop_forever, daemon=True)
             self._thread.start()
+            self._tx_thread = threading.Thread(target=self._flush_loop, daemon=True, name="mqtt-tx")
+            self._tx_thread.start()
+            with self._tx_lock:
+                self._tx_open = True
 
     def publish(self, topic: str, payload: str) -> None:
         LOGGER.debug("MQTT publish %s => %s", topic, payload)
+        with self._tx_lock:
+            if self._tx_open:
+                self._tx_q.put((topic, payload))
+                return
+        # Mock client, or no flusher running: publish inline
+        if self._stopped:
+            LOGGER.warning("MQTT publish %s after stop(); broker is disconnected", topic)
         self._client.publish(topic, payload)
 
+    def _flush_loop(self) -> None:
+        """Drain queued publishes in bursts until stop() queues _TX_STOP."""
+        while True:
+            batch = [self._tx_q.get()]
+            try:
+                while True:
+                    batch.append(self._tx_q.get_nowait())
+            except queue.Empty:
+                pass
+            for item in batch:
+                if item is _TX_STOP:
+                    return
+                topic, payload = item
+                try:
+                    self._client.publish(topic, payload)
+                except Exception as exc:  # pylint: disable=broad-except
+                    LOGGER.warning("MQTT publish %s failed: %s", topic, exc)
+
     def subscribe(self, topic: str, handler: Callable[[str], None]) -> None:
         LOGGER.info("MQTT subscribe %s", topic)
         self._callbacks[topic] = handler
@@ -82,6 +125,14 @@ class MqttBus:
 
     def stop(self) -> None:
         LOGGER.info("Stopping MQTT bus")
+        self._stopped = True
+        if self._tx_thread is not None:
+            # Let already-queued messages go out before disconnecting
+            with self._tx_lock:
+                self._tx_open = False
+                self._tx_q.put(_TX_STOP)
+            self._tx_thread.join(timeout=1.0)
+            self._tx_thread = None
         self._client.disconnect()
 
     # pylint: disable=unused-argument
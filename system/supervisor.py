@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import threading
-import time
 from typing import Callable, Dict
 
 from system.logger import get_logger
@@ -49,4 +48,5 @@ class Supervisor:
                 if not thread.is_alive():
                     LOGGER.warning("Restarting worker %s", name)
                     self._spawn(name, self._targets[name])
-            time.sleep(2)
+            if self._stop.wait(timeout=2.0):
+                break
@@ -1,3 +1,5 @@
+import logging
+import time
 import types
 
 from system import mqtt_bus
@@ -40,5 +42,36 @@ def test_publish_and_handler(monkeypatch):
     bus._on_connect(None, None, None, 0)
     bus._on_message(None, None, message)
     bus.publish("system/heartbeat", "alive")
+    bus.stop()  # publishes go out on the flusher thread; stop() drains it
     assert seen["payload"] == "hello"
     assert dummy.published[0] == ("system/heartbeat", "alive")
+
+
+class SlowClient(DummyClient):
+    def publish(self, topic, payload):
+        time.sleep(0.005)  # slower than the caller, so messages pile up in the queue
+        super().publish(topic, payload)
+
+
+def test_stop_flushes_queued_publishes_in_order(monkeypatch):
+    client = SlowClient()
+    monkeypatch.setattr(mqtt_bus, "_build_client", lambda: client)
+    bus = mqtt_bus.MqttBus()
+    bus.start()
+    expected = [("session/state", str(i)) for i in range(20)]
+    for topic, payload in expected:
+        bus.publish(topic, payload)
+    bus.stop()
+    assert client.published == expected
+
+
+def test_publish_after_stop_is_sent_inline_with_warning(monkeypatch, caplog):
+    dummy = DummyClient()
+    monkeypatch.setattr(mqtt_bus, "_build_client", lambda: dummy)
+    bus = mqtt_bus.MqttBus()
+    bus.start()
+    bus.stop()
+    with caplog.at_level(logging.WARNING):
+        bus.publish("session/end", "late")
+    assert dummy.published == [("session/end", "late")]
+    assert any("after stop()" in rec.message for rec in caplog.records)
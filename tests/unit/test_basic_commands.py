@@ -0,0 +1,108 @@
+import threading
+import time
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from sessions.modules import basic_commands as bc
+
+
+@pytest.fixture
+def quiet(monkeypatch):
+    """Sim mode with prompts, UI face, sleeps and GPIO resets patched out."""
+    monkeypatch.setattr(bc, "USE_SIM", True)
+    monkeypatch.setattr(bc, "_play_prompt", lambda filename, safety: None)
+    monkeypatch.setattr(bc, "_update_ui_face", lambda mode: None)
+    monkeypatch.setattr(bc, "_safe_sleep", lambda seconds, safety: None)
+    monkeypatch.setattr(bc.motors, "reset_to_safe", lambda: None)
+    yield
+    bc._stop_event.clear()
+
+
+@pytest.fixture
+def far_away(monkeypatch):
+    """Ultrasonic readers that never see an obstacle; short moves."""
+    monkeypatch.setattr(bc, "_distance_reader", lambda sensor: lambda: 200.0)
+    monkeypatch.setattr(bc, "_MOTION_DURATION_S", 0.01)
+
+
+@pytest.mark.parametrize("command", sorted(bc._MOTION_COMMANDS))
+def test_motion_command_driver_calls(quiet, far_away, command):
+    driver = MagicMock()
+    bc._perform_safe_command(command, safety=None, driver=driver)
+
+    _, steps, _ = bc._MOTION_COMMANDS[command]
+    expected = [getattr(call, method)(*args) for method, *args in steps]
+    assert driver.method_calls == expected + [call.brake()]
+
+
+def test_stop_command_brakes(quiet):
+    driver = MagicMock()
+    bc._perform_safe_command("stop", safety=None, driver=driver)
+
+    assert driver.method_calls == [call.brake()]
+
+
+def test_ultrasonic_brake_fires_on_obstacle(quiet, monkeypatch):
+    readings = iter([50.0, 10.0])
+    monkeypatch.setattr(bc, "_distance_reader", lambda sensor: lambda: next(readings, 10.0))
+    driver = MagicMock()
+
+    start = time.monotonic()
+    bc._drive_with_ultrasonic_brake(driver, "forward", "front", 20.0, safety=None)
+
+    driver.brake.assert_called_once_with()
+    assert time.monotonic() - start < bc._MOTION_DURATION_S
+
+
+def test_led_stopped_when_handler_raises(quiet, far_away, monkeypatch):
+    def show(mode, duration=1.0, safety=None, stop_event=None):
+        stop_event.wait(duration)
+
+    started = []
+
+    def start(mode):
+        animation = real_start(mode)
+        started.append(animation)
+        return animation
+
+    real_start = bc._start_face_led
+    monkeypatch.setattr(bc, "_show_face_led", show)
+    monkeypatch.setattr(bc, "_start_face_led", start)
+    driver = MagicMock()
+    driver.forward.side_effect = RuntimeError("driver fault")
+
+    with pytest.raises(RuntimeError):
+        bc._perform_safe_command("forward", safety=None, driver=driver)
+
+    (done, stop_event), = started
+    assert stop_event.is_set()
+    assert done.is_set()
+
+
+def test_safe_sleep_returns_early_on_stop():
+    safety = MagicMock(timeout=2.0)
+    timer = threading.Timer(0.05, bc._stop_event.set)
+    timer.start()
+    try:
+        start = time.monotonic()
+        bc._safe_sleep(5.0, safety)
+        elapsed = time.monotonic() - start
+    finally:
+        timer.cancel()
+        bc._stop_event.clear()
+
+    assert elapsed < 1.0
+    assert safety.heartbeat.called
+
+
+def test_exit_shuts_down_executors(quiet, monkeypatch):
+    monkeypatch.setattr(bc.motors, "cleanup", lambda: None)
+    monkeypatch.setattr(bc.hcsr04_back, "cleanup", lambda: None)
+    executor = bc._get_executor("face")
+
+    bc.BasicCommandsModule(safety=MagicMock()).exit()
+
+    assert bc._executors == {}
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
@@ -170,7 +170,7 @@ class TestPerform360Rotation(unittest.TestCase):
             patch("sessions.modules.basic_commands.time") as mock_time,
         ):
             # First call: start_time=0.0; second+ calls: elapsed > rotation_duration (3.15s)
-            mock_time.time.side_effect = [0.0] + [10.0] * 50
+            mock_time.monotonic.side_effect = [0.0] + [10.0] * 50
             from sessions.modules.basic_commands import _perform_360_rotation
             _perform_360_rotation(safety=None)
 
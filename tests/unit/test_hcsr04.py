@@ -5,3 +5,11 @@ def test_distance_cycle():
     values = [simulator.read_distance_cm() for _ in range(4)]
     assert min(values) >= 30
     assert max(values) <= 50
+
+
+def test_distance_batch_continues_cycle():
+    values = simulator.read_distance_cm_batch(6)
+    assert len(values) == 6
+    assert min(values) >= 30
+    assert max(values) <= 50
+    assert values[:3] == values[3:]
@@ -1,3 +1,7 @@
+import sys
+
+import pytest
+
 from control import motors
 from system.config import CONFIG
 
@@ -28,46 +32,34 @@ class FakeLGPIO:
         pass
 
 
-def test_forward_and_stop_sets_pins():
+@pytest.fixture
+def fake_lgpio(monkeypatch):
+    """Route control.motors to a FakeLGPIO in hardware mode; monkeypatch reverts it."""
+    fake = FakeLGPIO()
+    monkeypatch.setitem(sys.modules, "lgpio", fake)
+    monkeypatch.setattr(motors, "GPIO", fake)
+    monkeypatch.setattr(motors, "LGPIO_AVAILABLE", True)
+    monkeypatch.setattr(motors, "USE_SIM", False)
+    # Reset driver singleton (restored to its previous value on teardown)
+    monkeypatch.setattr(motors, "_driver", None)
+    yield fake
+
+
+def test_forward_and_stop_sets_pins(fake_lgpio):
     """Test TB6612 motor control with Motor A polarity fix."""
-    import control.motors as motors_module
-    import sys
-    
-    # Mock lgpio
-    fake_lgpio = FakeLGPIO()
-    original_lgpio = sys.modules.get('lgpio')
-    sys.modules['lgpio'] = fake_lgpio
-    motors_module.GPIO = fake_lgpio
-    motors_module.LGPIO_AVAILABLE = True
-    
-    # Reset driver singleton
-    motors_module._driver = None
-    
-    # Force non-simulator mode
-    original_sim = motors_module.USE_SIM
-    motors_module.USE_SIM = False
-    
-    try:
-        motors.forward()
-        # TB6612 Motor A: AIN1=LOW (0), AIN2=HIGH (1) for forward
-        # TB6612 Motor B: BIN1=HIGH (1), BIN2=LOW (0) for forward
-        assert motors_module.AIN1_PIN in fake_lgpio.state
-        assert motors_module.AIN2_PIN in fake_lgpio.state
-        assert fake_lgpio.state[motors_module.AIN1_PIN] == fake_lgpio.LOW  # Motor A polarity fix
-        assert fake_lgpio.state[motors_module.AIN2_PIN] == fake_lgpio.HIGH
-        assert fake_lgpio.state[motors_module.BIN1_PIN] == fake_lgpio.HIGH
-        assert fake_lgpio.state[motors_module.BIN2_PIN] == fake_lgpio.LOW
-        
-        motors.stop()
-        # After stop (coast), all direction pins should be LOW
-        assert fake_lgpio.state[motors_module.AIN1_PIN] == fake_lgpio.LOW
-        assert fake_lgpio.state[motors_module.AIN2_PIN] == fake_lgpio.LOW
-        assert fake_lgpio.state[motors_module.BIN1_PIN] == fake_lgpio.LOW
-        assert fake_lgpio.state[motors_module.BIN2_PIN] == fake_lgpio.LOW
-    finally:
-        motors_module.USE_SIM = original_sim
-        motors_module._driver = None
-        if original_lgpio:
-            sys.modules['lgpio'] = original_lgpio
-        elif 'lgpio' in sys.modules:
-            del sys.modules['lgpio']
+    motors.forward()
+    # TB6612 Motor A: AIN1=LOW (0), AIN2=HIGH (1) for forward
+    # TB6612 Motor B: BIN1=HIGH (1), BIN2=LOW (0) for forward
+    assert motors.AIN1_PIN in fake_lgpio.state
+    assert motors.AIN2_PIN in fake_lgpio.state
+    assert fake_lgpio.state[motors.AIN1_PIN] == fake_lgpio.LOW  # Motor A polarity fix
+    assert fake_lgpio.state[motors.AIN2_PIN] == fake_lgpio.HIGH
+    assert fake_lgpio.state[motors.BIN1_PIN] == fake_lgpio.HIGH
+    assert fake_lgpio.state[motors.BIN2_PIN] == fake_lgpio.LOW
+
+    motors.stop()
+    # After stop (coast), all direction pins should be LOW
+    assert fake_lgpio.state[motors.AIN1_PIN] == fake_lgpio.LOW
+    assert fake_lgpio.state[motors.AIN2_PIN] == fake_lgpio.LOW
+    assert fake_lgpio.state[motors.BIN1_PIN] == fake_lgpio.LOW
+    assert fake_lgpio.state[motors.BIN2_PIN] == fake_lgpio.LOW
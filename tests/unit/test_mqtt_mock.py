@@ -4,9 +4,9 @@ from system import config
 from system.mqtt_bus import MqttBus
 
 
-def test_mock_publish_logs(caplog):
+def test_mock_publish_logs(caplog, monkeypatch):
     caplog.set_level(logging.INFO)
-    config.CONFIG["services"]["runtime"]["use_simulator"] = True
+    monkeypatch.setitem(config.CONFIG["services"]["runtime"], "use_simulator", True)
     bus = MqttBus()
     bus.start()
     bus.publish("tokymon/test", "ping")
@@ -0,0 +1,39 @@
+from sessions.orchestrator import ExecRecord, SessionOrchestrator
+
+
+def _run_session(orchestrator, max_ticks=50):
+    orchestrator.start_session(selected_modules=["object_identification"])
+    results = []
+    for _ in range(max_ticks):
+        if not orchestrator.is_session_active():
+            break
+        results.append(orchestrator.run())
+    return results
+
+
+def test_run_and_get_session_results_share_one_shape():
+    orchestrator = SessionOrchestrator()
+    ticks = _run_session(orchestrator)
+    assert not orchestrator.is_session_active()
+
+    last = ticks[-1]
+    final = orchestrator.get_session_results()
+    assert last.keys() == final.keys()
+    for key in ("modules_run", "execution_log"):
+        assert type(last[key]) is type(final[key]) is tuple
+    assert last["execution_log"] == final["execution_log"]
+    assert final["execution_log"]
+    for record in final["execution_log"]:
+        assert isinstance(record, ExecRecord)
+        assert record.module_name == "object_identification"
+        assert record._asdict()["completed"] is True
+
+    copied = orchestrator.get_session_results(copy=True)
+    assert copied["execution_log"] == list(final["execution_log"])
+
+
+def test_run_returns_a_new_dict_each_tick():
+    orchestrator = SessionOrchestrator()
+    ticks = _run_session(orchestrator)
+    ticks[0]["extra"] = True
+    assert all("extra" not in result for result in ticks[1:])
@@ -0,0 +1,47 @@
+import types
+from collections import OrderedDict
+
+import pytest
+
+from voice import tts
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    """Route tts's espeak/aplay calls to a recorder; espeak returns fake WAV bytes."""
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append((cmd[0], cmd, kwargs))
+        if cmd[0] == "espeak":
+            return types.SimpleNamespace(stdout=b"WAV:" + cmd[1].encode("utf-8"))
+        return types.SimpleNamespace(stdout=None)
+
+    monkeypatch.setattr(tts, "USE_SIM", False)
+    monkeypatch.setattr(tts, "_CACHE", OrderedDict())
+    monkeypatch.setattr(tts.subprocess, "run", run)
+    return calls
+
+
+def test_repeat_replays_cached_wav(fake_run):
+    first = tts.synthesize("hi")
+    second = tts.synthesize("hi")
+
+    assert first == second == b"WAV:hi"
+    espeak = [c for c in fake_run if c[0] == "espeak"]
+    aplay = [c for c in fake_run if c[0] == "aplay"]
+    assert len(espeak) == 1
+    assert len(aplay) == 2
+    assert all(kwargs["input"] == b"WAV:hi" for _, _, kwargs in aplay)
+
+
+def test_cache_evicts_oldest_past_limit(fake_run):
+    for i in range(tts._CACHE_MAX):
+        tts.synthesize(f"line {i}")
+    tts.synthesize("line 0")  # hit: now the most recently used
+    tts.synthesize("one more")
+
+    assert len(tts._CACHE) == tts._CACHE_MAX
+    assert "line 0" in tts._CACHE
+    assert "line 1" not in tts._CACHE
+    assert next(reversed(tts._CACHE)) == "one more"
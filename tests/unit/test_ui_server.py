@@ -4,7 +4,7 @@ Coverage areas
 --------------
 1.  HTML payload  — DOCTYPE, all 6 expressions, SSE JS, neon filter
 2.  /api/state    — returns JSON with face_mode, correct Content-Type
-3.  /api/events   — SSE headers, immediate first event, mode-change push
+3.  /api/events   — SSE headers, immediate first event, set_face_mode push
 4.  Threading     — _ThreadedHTTPServer inherits ThreadingMixIn
 5.  Lifecycle     — start / stop idempotency, double-start guard
 6.  Fallback      — unknown face_mode maps to waiting, not a crash
@@ -164,14 +164,52 @@ class TestStateEndpoint:
 
     def test_state_reflects_ui_state_change(self, running_server):
         import sessions.modules.ui_server as mod
-        with mod._ui_lock:
-            mod._ui_state["face_mode"] = "speaking"
+        mod.set_face_mode("speaking")
         r = _get(running_server, "/api/state")
         body = json.loads(r.read())
         assert body["face_mode"] == "speaking"
         # restore
-        with mod._ui_lock:
-            mod._ui_state["face_mode"] = "normal_smile"
+        mod.set_face_mode("normal_smile")
+
+    def test_keep_alive_reuses_connection(self, running_server):
+        import http.client
+        conn = http.client.HTTPConnection("127.0.0.1", running_server, timeout=2.0)
+        try:
+            socks = []
+            for _ in range(3):
+                conn.request("GET", "/api/state")
+                r = conn.getresponse()
+                assert r.version == 11
+                assert not r.will_close
+                assert "face_mode" in json.loads(r.read())
+                socks.append(conn.sock)
+            # http.client silently reconnects, so check it really is one socket
+            assert socks[0] is not None
+            assert all(sock is socks[0] for sock in socks)
+        finally:
+            conn.close()
+
+    def test_matching_etag_returns_304(self, running_server):
+        r = _get(running_server, "/api/state")
+        etag = r.headers.get("ETag")
+        assert etag
+        req = urllib.request.Request(
+            f"http://127.0.0.1:{running_server}/api/state",
+            headers={"If-None-Match": etag},
+        )
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(req, timeout=2.0)
+        assert exc_info.value.code == 304
+
+    def test_etag_changes_with_face_mode(self, running_server):
+        import sessions.modules.ui_server as mod
+        mod.set_face_mode("speaking")
+        before = _get(running_server, "/api/state").headers.get("ETag")
+        mod.set_face_mode("moving")
+        after = _get(running_server, "/api/state").headers.get("ETag")
+        assert before != after
+        # restore
+        mod.set_face_mode("normal_smile")
 
 
 # ── 3. /api/events SSE endpoint ───────────────────────────────────────────────
@@ -231,8 +269,7 @@ class TestSSEEndpoint:
         time.sleep(0.2)  # wait for initial event
 
         # Change mode and measure latency
-        with mod._ui_lock:
-            mod._ui_state["face_mode"] = "moving"
+        mod.set_face_mode("moving")
         t0 = time.time()
 
         deadline = t0 + 0.5
@@ -252,8 +289,7 @@ class TestSSEEndpoint:
         assert latency_ms < 50, f"SSE latency {latency_ms:.1f} ms exceeds 50 ms budget"
 
         # restore
-        with mod._ui_lock:
-            mod._ui_state["face_mode"] = "normal_smile"
+        mod.set_face_mode("normal_smile")
 
     def test_cors_header_on_sse(self, running_server):
         raw = _sse_headers_and_first_event(running_server)
@@ -1,6 +1,8 @@
 """Camera access wrapper."""
 from __future__ import annotations
 
+import atexit
+import threading
 import time
 from pathlib import Path
 from typing import Optional
@@ -12,6 +14,13 @@ except ImportError:
     NUMPY_AVAILABLE = False
     np = None  # type: ignore
 
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+    cv2 = None  # type: ignore
+
 try:
     from PIL import Image
     PIL_AVAILABLE = True
@@ -34,6 +43,193 @@ FRAME_DIR.mkdir(parents=True, exist_ok=True)
 LOGGER.info("Camera frames directory: %s", FRAME_DIR)
 
 USE_SIM = CONFIG["services"]["runtime"].get("use_simulator", False)
+# services.yaml vision.save_frames: keep every captured frame as a JPEG in
+# FRAME_DIR for debugging. When off, capture_frame_np() skips the file entirely.
+_SAVE_FRAMES = CONFIG["services"].get("vision", {}).get("save_frames", True)
+# Throwaway JPEGs (save_frames off) go to RAM-backed /dev/shm when the host
+# has it, so they neither cost SD-card I/O nor wear the card
+TRANSIENT_DIR = Path("/dev/shm/tokymon_frames") if Path("/dev/shm").is_dir() else FRAME_DIR
+TRANSIENT_DIR.mkdir(parents=True, exist_ok=True)
+
+_FRAME_W, _FRAME_H = 640, 480
+_RPICAM_STILL = (
+    "rpicam-still",
+    "-n",
+    "--zsl",
+    "--timeout", "200",
+    "--rotation", "180",  # Handle upside-down mounting
+    "--width", str(_FRAME_W),
+    "--height", str(_FRAME_H),
+)
+
+
+# services.yaml vision.stream: keep one rpicam-vid running and take frames
+# from it instead of starting rpicam-still (and the ISP) for every capture.
+# Needs OpenCV for the YUV conversion. The camera stays busy while it runs.
+_STREAM_ENABLED = bool(CONFIG["services"].get("vision", {}).get("stream", False))
+_STREAM_FPS = 10
+
+
+class _PiCamStream:
+    """Long-lived rpicam-vid process; a reader thread keeps only the newest frame."""
+
+    _FRAME_BYTES = _FRAME_W * _FRAME_H * 3 // 2  # YUV420 (I420)
+
+    def __init__(self) -> None:
+        self._proc = subprocess.Popen(
+            [
+                "rpicam-vid",
+                "-n",
+                "--timeout", "0",
+                "--codec", "yuv420",
+                "--framerate", str(_STREAM_FPS),
+                "--rotation", "180",  # Handle upside-down mounting
+                "--width", str(_FRAME_W),
+                "--height", str(_FRAME_H),
+                "-o", "-",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+        self._cond = threading.Condition()
+        self._latest: Optional[bytes] = None
+        self._seq = 0
+        self._closed = False
+        threading.Thread(target=self._reader, daemon=True, name="camera-stream").start()
+
+    def _reader(self) -> None:
+        """Drain stdout continuously so frames are never stale in the pipe."""
+        stdout = self._proc.stdout
+        try:
+            while True:
+                buf = bytearray()
+                while len(buf) < self._FRAME_BYTES:
+                    chunk = stdout.read(self._FRAME_BYTES - len(buf))
+                    if not chunk:
+                        return
+                    buf += chunk
+                with self._cond:
+                    self._latest = bytes(buf)
+                    self._seq += 1
+                    self._cond.notify_all()
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+
+    @property
+    def alive(self) -> bool:
+        return not self._closed
+
+    def read_bgr(self, timeout: float = 2.0) -> Optional[object]:  # np.ndarray when available
+        """Wait for a frame captured after this call and return it as BGR."""
+        with self._cond:
+            seq = self._seq
+            self._cond.wait_for(lambda: self._seq > seq or self._closed, timeout=timeout)
+            if self._seq == seq:
+                return None
+            buf = self._latest
+        yuv = np.frombuffer(buf, dtype=np.uint8).reshape(_FRAME_H * 3 // 2, _FRAME_W)
+        return cv2.cvtColor(yuv, cv2.COLOR_YUV2BGR_I420)
+
+    def close(self) -> None:
+        if self._proc.poll() is None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+
+
+_stream: Optional[_PiCamStream] = None
+_stream_lock = threading.Lock()
+
+# Consecutive stream failures (failed start or no frame) before giving
+# up on the stream for the rest of the process; captures then use rpicam-still
+_STREAM_MAX_FAILURES = 3
+_stream_failures = 0
+
+
+def _close_stream() -> None:
+    """Stop the shared stream, if running (also run at interpreter exit)."""
+    global _stream
+    with _stream_lock:
+        if _stream is not None:
+            _stream.close()
+            _stream = None
+
+
+atexit.register(_close_stream)
+
+
+def _stream_failed(reason: str) -> None:
+    """Count a stream failure; past _STREAM_MAX_FAILURES, stop and disable it. Caller holds _stream_lock."""
+    global _stream, _stream_failures
+    _stream_failures += 1
+    if _stream_failures < _STREAM_MAX_FAILURES:
+        LOGGER.warning("Camera stream %s (%d/%d)", reason, _stream_failures, _STREAM_MAX_FAILURES)
+        return
+    LOGGER.warning("Camera stream %s %d times in a row; falling back to rpicam-still",
+                   reason, _stream_failures)
+    if _stream is not None:
+        _stream.close()
+        _stream = None
+
+
+def _stream_frame_bgr() -> Optional[object]:  # np.ndarray when available
+    """Next frame from the shared stream (started on first use), or None."""
+    global _stream, _stream_failures
+    with _stream_lock:
+        if _stream_failures >= _STREAM_MAX_FAILURES:
+            return None
+        if _stream is None or not _stream.alive:
+            if _stream is not None:
+                # Its failed read (if any) was already counted
+                LOGGER.warning("Camera stream exited; restarting rpicam-vid")
+                _stream.close()
+            try:
+                _stream = _PiCamStream()
+            except OSError as exc:
+                _stream_failed(f"failed to start: {exc}")
+                return None
+        stream = _stream
+    frame = stream.read_bgr()
+    with _stream_lock:
+        if frame is None:
+            _stream_failed("returned no frame")
+        else:
+            _stream_failures = 0
+    return frame
+
+
+def _capture_raw_bgr() -> Optional[object]:  # np.ndarray when available
+    """
+    Capture straight to stdout as uncompressed RGB and return it as BGR,
+    skipping the JPEG encode, file write and decode. Returns None if the
+    output is not a plain 640x480x3 buffer, so the caller can fall back.
+    """
+    proc = subprocess.run(
+        [*_RPICAM_STILL, "--encoding", "rgb", "-o", "-"],
+        check=True,
+        timeout=5,
+        capture_output=True,
+    )
+    buf = proc.stdout
+    if len(buf) != _FRAME_W * _FRAME_H * 3:
+        LOGGER.warning("Unexpected raw frame size %d bytes; falling back to JPEG", len(buf))
+        return None
+    rgb = np.frombuffer(buf, dtype=np.uint8).reshape(_FRAME_H, _FRAME_W, 3)
+    if CV2_AVAILABLE:
+        return cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+    return np.ascontiguousarray(rgb[:, :, ::-1])
+
+
+def _frame_path(context: str) -> Path:
+    """Path for the next captured JPEG: FRAME_DIR if kept, else TRANSIENT_DIR."""
+    ts = int(time.time() * 1000)
+    safe_context = context.replace(" ", "_").lower()
+    return (FRAME_DIR if _SAVE_FRAMES else TRANSIENT_DIR) / f"frame_{ts}_{safe_context}.jpg"
 
 
 def capture_frame(context: str = "unknown") -> Optional[object]:  # Image.Image when available
@@ -42,15 +238,18 @@ def capture_frame(context: str = "unknown") -> Optional[object]:  # Image.Image
         LOGGER.warning("PIL/Pillow not available - camera capture disabled")
         return None
     
-    ts = int(time.time() * 1000)
-    safe_context = context.replace(" ", "_").lower()
-    img_path = FRAME_DIR / f"frame_{ts}_{safe_context}.jpg"
+    img_path = _frame_path(context)
     LOGGER.info("Capturing frame from Pi camera (context=%s)", context)
 
     if USE_SIM:
         LOGGER.debug("Camera capture (simulator): returning blank image")
         return Image.new("RGB", (640, 480), color="black")
 
+    if _STREAM_ENABLED and CV2_AVAILABLE and NUMPY_AVAILABLE:
+        img_bgr = _stream_frame_bgr()
+        if img_bgr is not None:
+            return Image.fromarray(cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB))
+
     subprocess.run(
         [
             "rpicam-still",
@@ -67,9 +266,9 @@ def capture_frame(context: str = "unknown") -> Optional[object]:  # Image.Image
     )
 
     img = Image.open(img_path)
+    img.load()
 
-    if CONFIG.get("vision", {}).get("save_frames", False):
-        img.save(img_path)
+    if _SAVE_FRAMES:
         LOGGER.info("Saved camera frame: %s", img_path)
     else:
         img_path.unlink(missing_ok=True)
@@ -77,6 +276,15 @@ def capture_frame(context: str = "unknown") -> Optional[object]:  # Image.Image
     return img
 
 
+def _read_jpeg_bgr_pil(img_path: Path) -> object:  # np.ndarray
+    """Decode a JPEG with PIL into a contiguous BGR array (no-OpenCV path)."""
+    img_array = np.asarray(Image.open(img_path))
+    if len(img_array.shape) == 3:
+        return np.ascontiguousarray(img_array[:, :, ::-1])
+    # Grayscale - convert to 3-channel
+    return np.stack([img_array, img_array, img_array], axis=2)
+
+
 def capture_frame_np(context: str = "unknown") -> Optional[object]:  # np.ndarray when available
     """
     Capture frame and return as OpenCV-compatible numpy array.
@@ -93,47 +301,45 @@ def capture_frame_np(context: str = "unknown") -> Optional[object]:  # np.ndarra
         return np.zeros((480, 640, 3), dtype=np.uint8)
     
     try:
+        if _STREAM_ENABLED and CV2_AVAILABLE:
+            img_bgr = _stream_frame_bgr()
+            if img_bgr is not None:
+                if _SAVE_FRAMES:
+                    img_path = _frame_path(context)
+                    cv2.imwrite(str(img_path), img_bgr)
+                    LOGGER.info("Saved camera frame: %s", img_path)
+                return img_bgr
+
+        if not _SAVE_FRAMES:
+            img_bgr = _capture_raw_bgr()
+            if img_bgr is not None:
+                return img_bgr
+
         # Capture using rpicam-still
-        ts = int(time.time() * 1000)
-        safe_context = context.replace(" ", "_").lower()
-        img_path = FRAME_DIR / f"frame_{ts}_{safe_context}.jpg"
+        img_path = _frame_path(context)
         
         LOGGER.debug("Capturing frame (context=%s)", context)
         
         subprocess.run(
-            [
-                "rpicam-still",
-                "-n",
-                "--zsl",
-                "--timeout", "200",
-                "--rotation", "180",  # Handle upside-down mounting
-                "--width", "640",
-                "--height", "480",
-                "-o", str(img_path)
-            ],
+            [*_RPICAM_STILL, "-o", str(img_path)],
             check=True,
             timeout=5,
             stderr=subprocess.DEVNULL,
             stdout=subprocess.DEVNULL
         )
         
-        # Load image
-        img = Image.open(img_path)
+        # Decode straight to BGR with OpenCV when present; PIL is the fallback
+        img_bgr = cv2.imread(str(img_path), cv2.IMREAD_COLOR) if CV2_AVAILABLE else None
+        if img_bgr is None:
+            img_bgr = _read_jpeg_bgr_pil(img_path)
         
-        # Convert PIL to numpy array (RGB)
-        img_array = np.array(img)
-        
-        # Convert RGB to BGR for OpenCV compatibility
-        if len(img_array.shape) == 3:
-            img_bgr = img_array[:, :, ::-1]  # RGB to BGR
+        # Keep frames for debugging (vision.save_frames); rpicam-still
+        # already wrote the JPEG there, so no re-encode is needed
+        if _SAVE_FRAMES:
+            LOGGER.info("Saved camera frame: %s", img_path)
+            LOGGER.info("Camera frame absolute path: %s", img_path.resolve())
         else:
-            # Grayscale - convert to 3-channel
-            img_bgr = np.stack([img_array, img_array, img_array], axis=2)
-        
-        # Always save frames for debugging (user requested)
-        img.save(img_path)
-        LOGGER.info("Saved camera frame: %s", img_path)
-        LOGGER.info("Camera frame absolute path: %s", img_path.resolve())
+            img_path.unlink(missing_ok=True)
         
         return img_bgr
         
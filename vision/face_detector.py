@@ -8,12 +8,15 @@ Public API (UNCHANGED — all callers work without modification)
 --------------------------------------------------------------
 face_present(frame, context="unknown") -> bool
     Binary presence check: True if ≥1 face detected.
+warm_up() -> None
+    Preload the detector so the first face_present() call is fast.
 
 All existing call-sites continue to work identically.  The upgrade is
 transparent — callers never need to import yunet_detector directly.
 """
 from __future__ import annotations
 
+import random
 from typing import Optional
 
 from system.config import CONFIG
@@ -29,8 +32,10 @@ except Exception:
 
 LOGGER = get_logger("face_detector")
 USE_SIM = CONFIG["services"]["runtime"].get("use_simulator", False)
+# Private RNG for simulated detections (doesn't share the global random state)
+_SIM_RNG = random.Random(CONFIG["services"]["runtime"].get("sim_seed"))
 
-# ── Legacy Haar path (kept verbatim as fallback) ──────────────────────────────
+# ── Legacy Haar path (kept as fallback) ───────────────────────────────────────
 
 try:
     import cv2
@@ -51,6 +56,9 @@ from pathlib import Path
 _MODEL_PATH = Path(__file__).parent.parent / "vision" / "models" / "haarcascade_frontalface_default.xml"
 _FALLBACK_MODEL_PATH = Path("/usr/share/opencv4/haarcascades/haarcascade_frontalface_default.xml")
 _HAAR_DETECTOR: Optional[object] = None
+# Frames whose sampled pixel std-dev is below this (blank, lens covered, dark
+# room) cannot contain a face; same gate as yunet_detector._is_flat
+_FLAT_STD_THRESHOLD = 5.0
 
 
 def _load_haar() -> Optional[object]:
@@ -81,7 +89,7 @@ def _load_haar() -> Optional[object]:
 
 
 def _haar_face_present(frame: Optional[object], context: str) -> bool:
-    """Legacy Haar Cascade face_present (exact original logic, preserved)."""
+    """Legacy Haar Cascade face_present (original logic, plus the flat-frame gate)."""
     if not CV2_AVAILABLE or cv2 is None:
         LOGGER.warning("OpenCV not available - face detection disabled")
         return False
@@ -96,6 +104,13 @@ def _haar_face_present(frame: Optional[object], context: str) -> bool:
     except Exception:
         pass
 
+    try:
+        if float(frame[::16, ::16].std()) < _FLAT_STD_THRESHOLD:
+            LOGGER.debug("Face detection (%s): False (flat frame)", context)
+            return False
+    except Exception:
+        pass
+
     detector = _load_haar()
     if detector is None:
         return False
@@ -157,8 +172,7 @@ def face_present(frame: Optional[object], context: str = "unknown") -> bool:  #
         bool: True if ≥1 face detected, False otherwise
     """
     if USE_SIM:
-        import random
-        return random.random() > 0.3
+        return _SIM_RNG.random() > 0.3
 
     if _YUNET_IMPORTED:
         return _fp(frame, context=context)
@@ -166,3 +180,17 @@ def face_present(frame: Optional[object], context: str = "unknown") -> bool:  #
     # Last-resort: legacy Haar path
     return _haar_face_present(frame, context)
 
+
+def warm_up() -> None:
+    """
+    Load the detector and run one inference on a blank frame so the first
+    real face_present() call doesn't pay the model load / first-run cost.
+    """
+    if USE_SIM or not NUMPY_AVAILABLE or np is None:
+        return
+    # Call the detector directly: face_present() short-circuits blank frames
+    blank = np.zeros((240, 320, 3), dtype=np.uint8)
+    if _YUNET_IMPORTED:
+        _detect(blank, context="warmup")
+    else:
+        _load_haar()
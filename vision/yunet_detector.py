@@ -23,8 +23,10 @@ is_available() -> bool
 from __future__ import annotations
 
 import os
+import random
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 try:
     import cv2
@@ -46,34 +48,87 @@ from system.logger import get_logger
 LOGGER = get_logger("yunet_detector")
 
 USE_SIM = CONFIG["services"]["runtime"].get("use_simulator", False)
+# Private RNG for simulated detections (doesn't share the global random state)
+_SIM_RNG = random.Random(CONFIG["services"]["runtime"].get("sim_seed"))
 
 # Model paths (in priority order)
 _MODEL_DIR = Path(__file__).parent / "models"
 _YUNET_MODEL = _MODEL_DIR / "face_detection_yunet_2023mar.onnx"
+# Haar fallback files present on this install, in priority order; resolved
+# once at import so a cold load does not re-stat every candidate
+_HAAR_MODEL_PATHS = tuple(
+    p for p in (
+        _MODEL_DIR / "haarcascade_frontalface_default.xml",
+        Path("/usr/share/opencv4/haarcascades/haarcascade_frontalface_default.xml"),
+        *((Path(cv2.data.haarcascades) / "haarcascade_frontalface_default.xml",)
+          if CV2_AVAILABLE and hasattr(cv2, "data") else ()),
+    )
+    if p.exists()
+)
 
 # Detection thresholds
 _SCORE_THRESHOLD = 0.6
 _NMS_THRESHOLD = 0.3
 _TOP_K = 5
 
+# face_present() only needs a yes/no, so with YuNet wider frames are
+# downsampled to this width first; detect() keeps full-resolution coordinates
+# for alignment. The Haar fallback keeps full frames: its 30-px minimum face
+# (at 640 px) would fall below the cascade's 24-px window at this width.
+_PRESENCE_MAX_WIDTH = 320
+# Haar size limits are tuned for 640-px-wide frames and scaled to other widths
+_HAAR_REF_WIDTH = 640
+# Frames whose sampled pixel std-dev is below this (blank, lens covered, dark
+# room) cannot contain a face; face_present() skips the detector for them
+_FLAT_STD_THRESHOLD = 5.0
+# Largest plausible face as a share of the image; also caps the cascade's maxSize
+_MAX_AREA_RATIO = 0.20
+
+# TOKY_FD_THREADS caps OpenCV's worker threads (e.g. to leave cores for the
+# session threads on a Pi); unset keeps OpenCV's default of one per core
+_FD_THREADS = os.getenv("TOKY_FD_THREADS", "").strip()
+
 # Global detector (loaded once)
 _DETECTOR: Optional[Any] = None
 _DETECTOR_LOADED: bool = False
 _DETECTOR_IS_YUNET: bool = False
+_DETECTOR_LOCK = threading.Lock()
+# Run the Haar cascade through OpenCV's T-API (cv2.UMat) when an OpenCL
+# device is usable; None until probed on first use, False after a failure
+_USE_OPENCL: Optional[bool] = None
 
 
 def _load_detector() -> Optional[Any]:
-    """Load YuNet detector; fall back to Haar Cascade if model absent."""
+    """Load YuNet detector; fall back to Haar Cascade if model absent.
+
+    Thread-safe: warm_up() may be loading on a worker while the first
+    face_present() call arrives; that caller waits for the load instead of
+    seeing a half-initialised (None) detector.
+    """
     global _DETECTOR, _DETECTOR_LOADED, _DETECTOR_IS_YUNET
 
     if _DETECTOR_LOADED:
         return _DETECTOR
 
-    _DETECTOR_LOADED = True
+    with _DETECTOR_LOCK:
+        if not _DETECTOR_LOADED:
+            _DETECTOR, _DETECTOR_IS_YUNET = _create_detector()
+            _DETECTOR_LOADED = True
+    return _DETECTOR
+
 
+def _create_detector() -> Tuple[Optional[Any], bool]:
+    """Build the detector: (YuNet, True), (Haar cascade, False) or (None, False)."""
     if not CV2_AVAILABLE or cv2 is None:
         LOGGER.warning("OpenCV not available — face detection disabled.")
-        return None
+        return None, False
+
+    cv2.setUseOptimized(True)
+    if _FD_THREADS:
+        try:
+            cv2.setNumThreads(max(1, int(_FD_THREADS)))
+        except ValueError:
+            LOGGER.warning("Ignoring invalid TOKY_FD_THREADS=%r", _FD_THREADS)
 
     # ── Try YuNet ────────────────────────────────────────────────────────────
     if _YUNET_MODEL.exists() and _YUNET_MODEL.stat().st_size > 1024:
@@ -86,36 +141,24 @@ def _load_detector() -> Optional[Any]:
                 nms_threshold=_NMS_THRESHOLD,
                 top_k=_TOP_K,
             )
-            _DETECTOR = det
-            _DETECTOR_IS_YUNET = True
             LOGGER.info("YuNet detector loaded from: %s", _YUNET_MODEL)
-            return _DETECTOR
+            return det, True
         except Exception as exc:
             LOGGER.warning("YuNet load failed (%s) — falling back to Haar Cascade.", exc)
 
     # ── Fall back to Haar Cascade ─────────────────────────────────────────────
     LOGGER.info("YuNet model not found — using Haar Cascade detector.")
-    haar_candidates = [
-        _MODEL_DIR / "haarcascade_frontalface_default.xml",
-        Path("/usr/share/opencv4/haarcascades/haarcascade_frontalface_default.xml"),
-    ]
-    if hasattr(cv2, "data"):
-        haar_candidates.append(Path(cv2.data.haarcascades) / "haarcascade_frontalface_default.xml")
-
-    for candidate in haar_candidates:
-        if candidate.exists():
-            try:
-                cascade = cv2.CascadeClassifier(str(candidate))
-                if not cascade.empty():
-                    _DETECTOR = cascade
-                    _DETECTOR_IS_YUNET = False
-                    LOGGER.info("Haar Cascade loaded from: %s", candidate)
-                    return _DETECTOR
-            except Exception as exc:
-                LOGGER.warning("Haar load error: %s", exc)
+    for candidate in _HAAR_MODEL_PATHS:
+        try:
+            cascade = cv2.CascadeClassifier(str(candidate))
+            if not cascade.empty():
+                LOGGER.info("Haar Cascade loaded from: %s", candidate)
+                return cascade, False
+        except Exception as exc:
+            LOGGER.warning("Haar load error: %s", exc)
 
     LOGGER.warning("No face detector available.")
-    return None
+    return None, False
 
 
 def is_available() -> bool:
@@ -133,6 +176,9 @@ def is_yunet() -> bool:
 
 def _detect_yunet(detector: Any, frame: Any) -> List[Dict]:
     """Run YuNet inference; return list of face dicts."""
+    if frame.ndim == 2:
+        # YuNet's input layer takes 3 channels
+        frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
     h, w = frame.shape[:2]
     detector.setInputSize((w, h))
     _, faces = detector.detect(frame)
@@ -153,43 +199,93 @@ def _detect_yunet(detector: Any, frame: Any) -> List[Dict]:
     return results
 
 
+def _haar_detect(cascade: Any, gray: Any, **kwargs: Any) -> Any:
+    """cascade.detectMultiScale on gray, on the OpenCL device when available.
+
+    Most Pi OpenCV builds have no OpenCL device, so this is the plain CPU call
+    there; any OpenCL error disables the UMat path for the rest of the run.
+    """
+    global _USE_OPENCL
+    if _USE_OPENCL is None:
+        ocl = getattr(cv2, "ocl", None)
+        _USE_OPENCL = bool(ocl is not None and ocl.haveOpenCL() and ocl.useOpenCL())
+        if _USE_OPENCL:
+            LOGGER.info("Haar Cascade using OpenCL (cv2.UMat)")
+    if _USE_OPENCL:
+        try:
+            return cascade.detectMultiScale(cv2.UMat(gray), **kwargs)
+        except cv2.error as exc:
+            LOGGER.warning("OpenCL Haar detection failed (%s) — using CPU.", exc)
+            _USE_OPENCL = False
+    return cascade.detectMultiScale(gray, **kwargs)
+
+
 def _detect_haar(detector: Any, frame: Any) -> List[Dict]:
     """Run Haar Cascade inference; return list of face dicts (no landmarks)."""
     gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
-    faces = detector.detectMultiScale(
+    scale = gray.shape[1] / _HAAR_REF_WIDTH
+    min_side = max(24, int(30 * scale))  # 24 px is the cascade's native window
+    # Larger windows would fail the area-ratio filter below, so don't scan them
+    max_side = max(min_side, int((_MAX_AREA_RATIO * gray.shape[0] * gray.shape[1]) ** 0.5))
+    faces = _haar_detect(
+        detector,
         gray,
         scaleFactor=1.05,   # was 1.1 — finer scale steps catch faces at more distances
         minNeighbors=3,     # was 5 — less strict for eye-level camera at 1–2 m
-        minSize=(30, 30),   # was (40,40) — catch slightly smaller/more distant faces
-        maxSize=(400, 400),
+        minSize=(min_side, min_side),  # 30 px at 640 wide (was 40) — more distant faces
+        maxSize=(max_side, max_side),
         flags=cv2.CASCADE_SCALE_IMAGE,
     )
     results = []
     if len(faces) == 0:
         return results
 
-    img_area = gray.shape[0] * gray.shape[1]
-    for (x, y, w, h) in faces:
-        ar = w / h if h > 0 else 0
-        area_ratio = (w * h) / img_area if img_area > 0 else 0
-        if 0.5 <= ar <= 1.5 and 0.003 <= area_ratio <= 0.20:
-            # Synthesise approximate landmarks from bbox centre
-            cx, cy = x + w // 2, y + h // 2
-            lm = np.array([
-                [cx - w * 0.15, cy - h * 0.1],
-                [cx + w * 0.15, cy - h * 0.1],
-                [cx,            cy],
-                [cx - w * 0.12, cy + h * 0.15],
-                [cx + w * 0.12, cy + h * 0.15],
-            ], dtype=np.float32)
-            results.append({
-                "bbox": (x, y, w, h),
-                "landmarks": lm,
-                "confidence": 0.7,   # Haar has no real score; use fixed value
-            })
+    # Plausibility filter (aspect ratio and share of the image), vectorised
+    boxes = np.asarray(faces).reshape(-1, 4)
+    w = boxes[:, 2].astype(np.float32)
+    h = boxes[:, 3].astype(np.float32)
+    ar = w / np.maximum(h, 1.0)
+    area_ratio = (w * h) / float(gray.shape[0] * gray.shape[1])
+    mask = (ar >= 0.5) & (ar <= 1.5) & (area_ratio >= 0.003) & (area_ratio <= _MAX_AREA_RATIO)
+    for x, y, w, h in boxes[mask].tolist():
+        # Synthesise approximate landmarks from bbox centre
+        cx, cy = x + w // 2, y + h // 2
+        lm = np.array([
+            [cx - w * 0.15, cy - h * 0.1],
+            [cx + w * 0.15, cy - h * 0.1],
+            [cx,            cy],
+            [cx - w * 0.12, cy + h * 0.15],
+            [cx + w * 0.12, cy + h * 0.15],
+        ], dtype=np.float32)
+        results.append({
+            "bbox": (x, y, w, h),
+            "landmarks": lm,
+            "confidence": 0.7,   # Haar has no real score; use fixed value
+        })
     return results
 
 
+def _presence_frame(frame: Optional[Any]) -> Optional[Any]:
+    """Downsample frame to _PRESENCE_MAX_WIDTH for a YuNet presence check."""
+    if not CV2_AVAILABLE or frame is None or not hasattr(frame, "shape"):
+        return frame
+    _load_detector()
+    if not _DETECTOR_IS_YUNET:
+        return frame
+    h, w = frame.shape[:2]
+    if w <= _PRESENCE_MAX_WIDTH or h == 0:
+        return frame
+    new_h = max(1, round(h * _PRESENCE_MAX_WIDTH / w))
+    return cv2.resize(frame, (_PRESENCE_MAX_WIDTH, new_h), interpolation=cv2.INTER_AREA)
+
+
+def _is_flat(frame: Optional[Any]) -> bool:
+    """True if a sparse pixel sample of frame shows almost no contrast."""
+    if not NUMPY_AVAILABLE or frame is None or getattr(frame, "size", 0) == 0:
+        return False
+    return float(frame[::16, ::16].std()) < _FLAT_STD_THRESHOLD
+
+
 def detect(
     frame: Optional[Any],
     context: str = "unknown",
@@ -197,7 +293,9 @@ def detect(
     """Detect faces in a BGR frame.
 
     Args:
-        frame:   numpy BGR array (H, W, 3).
+        frame:   numpy BGR array (H, W, 3), or a single-channel (H, W) array
+                 such as the Y plane of a YUV capture; the Haar fallback
+                 uses that as is and skips its BGR->GRAY pass.
         context: label used in log messages only.
 
     Returns:
@@ -242,14 +340,17 @@ def face_present(
     """Binary face presence check — same contract as legacy Haar detector.
 
     Args:
-        frame:   BGR numpy array or None.
+        frame:   BGR or single-channel numpy array (see detect()), or None.
         context: label for logging.
 
     Returns:
         True if ≥1 face detected, False otherwise.
     """
     if USE_SIM:
-        import random
-        return random.random() > 0.3
+        return _SIM_RNG.random() > 0.3
 
-    return len(detect(frame, context=context)) > 0
+    small = _presence_frame(frame)
+    if _is_flat(small):
+        LOGGER.debug("face_present (%s): low-variance frame, skipping detector", context)
+        return False
+    return len(detect(small, context=context)) > 0
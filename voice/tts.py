@@ -3,45 +3,67 @@ from __future__ import annotations
 
 import os
 import subprocess
+from collections import OrderedDict
 
 from system.config import CONFIG
 from system.logger import get_logger
 
 LOGGER = get_logger("tts")
-_CACHE: dict[str, bytes] = {}
+# Most recently used utterances; the oldest entry is dropped past _CACHE_MAX
+_CACHE: "OrderedDict[str, bytes]" = OrderedDict()
+_CACHE_MAX = 256
+# Fixed speaker device
+SPEAKER_DEVICE = "plughw:3,0"
 USE_SIM = CONFIG["services"]["runtime"].get("use_simulator", False)
 
 
+def _cache_put(text: str, audio_data: bytes) -> None:
+    _CACHE[text] = audio_data
+    if len(_CACHE) > _CACHE_MAX:
+        _CACHE.popitem(last=False)
+
+
+def _play_wav(wav: bytes) -> None:
+    """Play a WAV buffer on the speaker through aplay."""
+    subprocess.run(
+        ["aplay", "-D", SPEAKER_DEVICE],
+        input=wav,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+
+
 def synthesize(text: str) -> bytes:
-    """Synthesize text to speech using espeak + aplay (from toky_voice.py)."""
+    """Speak text with espeak + aplay (from toky_voice.py); returns the WAV bytes.
+
+    The WAV from espeak is cached, so a repeated sentence is replayed
+    without running espeak again.
+    """
     if USE_SIM:
         LOGGER.info("TTS (simulator): %s", text)
         return text.encode("utf-8")
 
-    if text in _CACHE:
-        LOGGER.debug("TTS cache hit")
-        return _CACHE[text]
-
     try:
-        # Fixed speaker device
-        SPEAKER_DEVICE = "plughw:3,0"
-        espeak_cmd = ["espeak", text, "--stdout"]
-        aplay_cmd = ["aplay", "-D", SPEAKER_DEVICE]
-        espeak_proc = subprocess.Popen(espeak_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
-        aplay_proc = subprocess.Popen(
-            aplay_cmd, stdin=espeak_proc.stdout, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
-        )
-        espeak_proc.stdout.close()
-        audio_data, _ = aplay_proc.communicate()
-        LOGGER.info("TTS synthesized: %s", text[:50])
-        _CACHE[text] = audio_data
-        return audio_data
+        wav = _CACHE.get(text)
+        if wav is None:
+            wav = subprocess.run(
+                ["espeak", text, "--stdout"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            ).stdout
+            LOGGER.info("TTS synthesized: %s", text[:50])
+            _cache_put(text, wav)
+        else:
+            LOGGER.debug("TTS cache hit")
+            _CACHE.move_to_end(text)
+        _play_wav(wav)
+        return wav
     except FileNotFoundError:
         LOGGER.warning("espeak or aplay not found; falling back to print")
         print(f"Speaking: {text}")
-        audio_data = text.encode("utf-8")
-        _CACHE[text] = audio_data
-        return audio_data
+        return text.encode("utf-8")
     except Exception as exc:
         LOGGER.warning("TTS failed: %s", exc)
         return text.encode("utf-8")